@@ -1424,13 +1424,17 @@ def get_ticket_config(guild_id):
         
         if res.data and len(res.data) > 0:
             config = res.data[0]
+            # IDs are BIGINT columns; send them as strings so JS doesn't round them
+            def snowflake(key):
+                value = config.get(key)
+                return str(value) if value is not None else None
             return jsonify({
                 "success": True,
                 "config": {
-                    "ticket_channel_id": config.get('ticket_channel_id'),
-                    "ticket_category_id": config.get('ticket_category_id'),
-                    "admin_role_id": config.get('admin_role_id'),
-                    "transcript_channel_id": config.get('transcript_channel_id'),
+                    "ticket_channel_id": snowflake('ticket_channel_id'),
+                    "ticket_category_id": snowflake('ticket_category_id'),
+                    "admin_role_id": snowflake('admin_role_id'),
+                    "transcript_channel_id": snowflake('transcript_channel_id'),
                     "ticket_message": config.get('ticket_message', 'Click the button below to open a support ticket.'),
                     "welcome_message": config.get('welcome_message', 'Hello {user}, support will be with you shortly. Please describe your issue and we\'ll help you as soon as possible.')
                 }
@@ -1506,9 +1510,8 @@ def save_ticket_config(guild_id):
         
         # --- Trigger Discord Message ---
         try:
-            from ticket_system import TicketView
-            
             async def send_ticket_msg():
+                bot.ticket_system.invalidate_config_cache(guild_id)
                 channel_id = data.get('ticket_channel_id')
                 message_text = data.get('ticket_message', 'Click the button below to open a support ticket.')
                 
@@ -1525,7 +1528,7 @@ def save_ticket_config(guild_id):
                     description=message_text,
                     color=discord.Color.green()
                 )
-                await channel.send(embed=embed, view=TicketView(bot, bot.pool))
+                await channel.send(embed=embed, view=bot.ticket_system.ticket_view)
                 log.info(f"Successfully sent ticket setup message to channel {channel_id}")
 
             # Schedule the coroutine in the bot's event loop
@@ -2418,11 +2421,13 @@ def manage_youtube(guild_id):
             configs = []
             if yt_res.data:
                 for row in yt_res.data:
+                    role_id = row['mention_role_id']
                     configs.append({
                         "yt_id": row['yt_channel_id'],
                         "discord_channel_id": row['discord_channel_id'],
                         "custom_message": row['custom_message'],
-                        "notify_role_id": row['mention_role_id'],
+                        # BIGINT column; send as a string so JS doesn't round it
+                        "notify_role_id": str(role_id) if role_id is not None else None,
                         "name": "Channel " + row['yt_channel_id'],  # Fallback name
                         "thumbnail": None  # Optional: fetch from cache if available
                     })
@@ -2435,11 +2440,16 @@ def manage_youtube(guild_id):
             yt_channel_id = data.get("yt_channel_id") or data.get("yt_id")
             discord_channel_id = data.get("discord_channel_id") or data.get("target_channel")
             custom_msg = data.get("custom_message", "{channel} just uploaded a video! {link}")
-            role_id = data.get("notify_role_id") or data.get("role_id")
+            # The "None" role option sends ""; mention_role_id is a BIGINT column
+            role_id = str(data.get("notify_role_id") or data.get("role_id") or "").strip() or None
+            discord_channel_id = str(discord_channel_id or "").strip() or None
             yt_name = data.get("yt_name", "Unknown Channel")
 
             if not yt_channel_id or not discord_channel_id:
                 return jsonify({"error": "Missing required fields"}), 400
+            if not discord_channel_id.isdigit() or (role_id is not None and not role_id.isdigit()):
+                return jsonify({"error": "Invalid channel or role ID"}), 400
+            role_id = int(role_id) if role_id is not None else None
 
             # Insert/update configuration
             supabase.table('youtube_notification_config').upsert({
@@ -1517,13 +1517,17 @@ def get_ticket_config(guild_id):
         
         if res.data and len(res.data) > 0:
             config = res.data[0]
+            # IDs are BIGINT columns; send them as strings so JS doesn't round them
+            def snowflake(key):
+                value = config.get(key)
+                return str(value) if value is not None else None
             return jsonify({
                 "success": True,
                 "config": {
-                    "ticket_channel_id": config.get('ticket_channel_id'),
-                    "ticket_category_id": config.get('ticket_category_id'),
-                    "admin_role_id": config.get('admin_role_id'),
-                    "transcript_channel_id": config.get('transcript_channel_id'),
+                    "ticket_channel_id": snowflake('ticket_channel_id'),
+                    "ticket_category_id": snowflake('ticket_category_id'),
+                    "admin_role_id": snowflake('admin_role_id'),
+                    "transcript_channel_id": snowflake('transcript_channel_id'),
                     "ticket_message": config.get('ticket_message', 'Click the button below to open a support ticket.'),
                     "welcome_message": config.get('welcome_message', 'Hello {user}, support will be with you shortly. Please describe your issue and we\'ll help you as soon as possible.')
                 }
@@ -1599,9 +1603,8 @@ def save_ticket_config(guild_id):
         
         # --- Trigger Discord Message ---
         try:
-            from ticket_system import TicketView
-            
             async def send_ticket_msg():
+                bot.ticket_system.invalidate_config_cache(guild_id)
                 channel_id = data.get('ticket_channel_id')
                 message_text = data.get('ticket_message', 'Click the button below to open a support ticket.')
                 
@@ -1618,7 +1621,7 @@ def save_ticket_config(guild_id):
                     description=message_text,
                     color=discord.Color.green()
                 )
-                await channel.send(embed=embed, view=TicketView(bot, bot.pool))
+                await channel.send(embed=embed, view=bot.ticket_system.ticket_view)
                 log.info(f"Successfully sent ticket setup message to channel {channel_id}")
 
             # Schedule the coroutine in the bot's event loop
@@ -2645,11 +2648,13 @@ def manage_youtube(guild_id):
             configs = []
             if yt_res.data:
                 for row in yt_res.data:
+                    role_id = row['mention_role_id']
                     configs.append({
                         "yt_id": row['yt_channel_id'],
-                        "target_channel": row['target_channel_id'],
+                        # IDs are BIGINT columns; send them as strings so JS doesn't round them
+                        "target_channel": str(row['target_channel_id']),
                         "message": row['custom_message'],
-                        "role_id": row['mention_role_id'],
+                        "role_id": str(role_id) if role_id is not None else None,
                         "name": row.get('yt_channel_name') or ("Channel " + row['yt_channel_id']),
                         "thumbnail": None  # Optional: fetch from cache if available
                     })
@@ -2663,11 +2668,17 @@ def manage_youtube(guild_id):
             # Frontend sends 'target_channel', DB expects 'target_channel_id'
             target_channel_id = data.get("discord_channel_id") or data.get("target_channel")
             custom_msg = data.get("custom_message") or data.get("message") or "{channel} just uploaded a video! {link}"
-            role_id = data.get("notify_role_id") or data.get("role_id")
+            # The "None" role option sends ""; both ids are BIGINT columns
+            role_id = str(data.get("notify_role_id") or data.get("role_id") or "").strip() or None
+            target_channel_id = str(target_channel_id or "").strip() or None
             yt_name = data.get("yt_name", "Unknown Channel")
 
             if not yt_channel_id or not target_channel_id:
                 return jsonify({"error": "Missing required fields"}), 400
+            if not target_channel_id.isdigit() or (role_id is not None and not role_id.isdigit()):
+                return jsonify({"error": "Invalid channel or role ID"}), 400
+            target_channel_id = int(target_channel_id)
+            role_id = int(role_id) if role_id is not None else None
 
             # Insert/update configuration
             supabase.table('youtube_notification_config').upsert({
@@ -3560,15 +3571,27 @@ def run_flask_app():
 
     - Reads host/port/debug from environment.
     - Initializes DB pool and runs schema checks.
-    - Starts Flask with reloader disabled.
+    - Serves with Waitress when debug is off and it is installed,
+      otherwise starts the Flask dev server with reloader disabled.
     """
     host = os.getenv("FLASK_HOST", "0.0.0.0")
     port = int(os.getenv("FLASK_PORT", 5000))
-    debug = os.getenv("FLASK_DEBUG", "true").lower() == "true"
+    debug = os.getenv("FLASK_DEBUG", "false").lower() == "true"
 
     log.info(f"🌐 Flask Server starting on {host}:{port}")
     # init_db_pool() # Removed
     # check_and_migrate_schema() # Removed
+    if not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            log.warning("⚠️ waitress not installed - falling back to the Flask dev server")
+        else:
+            threads = int(os.getenv("FLASK_THREADS", 8))
+            log.info(f"🚀 Serving with Waitress ({threads} threads)")
+            serve(app, host=host, port=port, threads=threads, connection_limit=200)
+            return
+    log.info(f"🛠️ Serving with the Flask dev server (debug={debug})")
     app.run(host=host, port=port, debug=debug, use_reloader=False)
 
 
@@ -809,6 +809,13 @@ class AnalyticsManager:
             self.stats_reset_task.cancel()
         log.info("✅ Analytics Manager stopped")
 
+    @property
+    def background_tasks(self) -> list:
+        """
+        Tasks behind the weekly report and stats reset loops.
+        """
+        return [t for t in (self.weekly_report_task.get_task(), self.stats_reset_task.get_task()) if t is not None]
+
     # ------------------------------------------------------------------
     # Background Tasks
     # ------------------------------------------------------------------
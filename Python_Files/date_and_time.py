@@ -121,6 +121,13 @@ class DateTimeManager:
             self.main_update_loop.cancel()
         log.info("DateTimeManager loops stopped.")
 
+    @property
+    def background_tasks(self) -> list:
+        """
+        Running asyncio Tasks for the fast and main update loops.
+        """
+        return [t for t in (self.fast_update_check.get_task(), self.main_update_loop.get_task()) if t is not None]
+
     # ==========================
     # Emoji / Flag Utilities
     # ==========================
@@ -88,6 +88,9 @@ class JoinToCreateManager:
         self.deletion_tasks: Dict[int, asyncio.Task] = {}
         self.temp_channels: Dict[int, datetime] = {}  # {channel_id: created_at}
         
+        # One persistent control panel for all private channels (owners tracked per channel)
+        self.control_view = VoiceControlView(bot, pool)
+        
         log.info("✅ JoinToCreateManager initialized")
     
     async def start(self):
@@ -98,6 +101,7 @@ class JoinToCreateManager:
         """
         self.bot.add_listener(self.on_voice_state_update, "on_voice_state_update")
         self.bot.add_listener(self.on_guild_channel_delete, "on_guild_channel_delete")
+        self.bot.add_view(self.control_view)
         
         # Schema check
         await self.ensure_schema()
@@ -119,6 +123,13 @@ class JoinToCreateManager:
                 task.cancel()
         
         log.info("🛑 Join-to-Create system stopped")
+
+    @property
+    def background_tasks(self) -> list:
+        """
+        Pending channel-deletion tasks, awaited by `SupporterBot.close()`.
+        """
+        return list(self.deletion_tasks.values())
     
     # ==========================
     # Configuration Management
@@ -440,14 +451,13 @@ class JoinToCreateManager:
                 
                 # If Private, send Control Panel
                 if is_private:
-                    # VoiceControlView is now imported globally
-                    view = VoiceControlView(self.bot, self.pool, member.id)
+                    self.control_view.owners[temp_channel.id] = member.id
                     embed = discord.Embed(
                         title="🔒 Private Voice Controls",
                         description=f"Welcome {member.mention}! You are the owner of this channel.\nUse the buttons below to manage permissions.",
                         color=discord.Color.gold()
                     )
-                    await temp_channel.send(member.mention, embed=embed, view=view)
+                    await temp_channel.send(member.mention, embed=embed, view=self.control_view)
 
             except discord.HTTPException as e:
                 log.error(f"❌ Failed to move {member.name} to temp channel: {e}")
@@ -577,6 +587,7 @@ class JoinToCreateManager:
             # Clean up tracking
             if channel_id in self.temp_channels:
                 del self.temp_channels[channel_id]
+            self.control_view.owners.pop(channel_id, None)
             if channel_id in self.deletion_tasks:
                 del self.deletion_tasks[channel_id]
         
@@ -614,6 +625,7 @@ class JoinToCreateManager:
             
             # Clean up tracking
             self.temp_channels.pop(channel.id, None)
+            self.control_view.owners.pop(channel.id, None)
             if channel.id in self.deletion_tasks:
                 task = self.deletion_tasks[channel.id]
                 if not task.done():
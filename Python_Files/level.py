@@ -75,6 +75,13 @@ class LevelManager:
             self.cleanup_cooldowns.cancel()
         log.info("LevelManager loops stopped.")
 
+    @property
+    def background_tasks(self) -> list:
+        """
+        Tasks behind the reset and cooldown-cleanup loops.
+        """
+        return [t for t in (self.reset_loop.get_task(), self.cleanup_cooldowns.get_task()) if t is not None]
+
     # ==========================
     # Guild Settings Management
     # ==========================
@@ -62,6 +62,13 @@ class ReminderManager:
             self.check_reminders_task.cancel()
         log.info("ReminderManager task stopped.")
 
+    @property
+    def background_tasks(self) -> list:
+        """
+        The asyncio Task driving the reminder polling loop, if started.
+        """
+        return [t for t in (self.check_reminders_task.get_task(),) if t is not None]
+
     def _calculate_next_run(self, current_run: datetime, interval: str):
         """
         Calculate the next execution time for a reminder.
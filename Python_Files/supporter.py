@@ -15,6 +15,9 @@ import os
 import logging
 import asyncpg
 import asyncio
+import contextlib
+import hashlib
+import json
 from datetime import datetime, timezone, timedelta
 
 # ==========================
@@ -51,6 +54,16 @@ from join_to_create import JoinToCreateManager
 # ==========================
 TOKEN = os.getenv("DISCORD_TOKEN")
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Named prepared statements are backend-local, so they are only created when
+# the pool talks to Postgres directly or through a session-mode pooler.
+PGBOUNCER_TRANSACTION_MODE = (
+    os.getenv("PGBOUNCER_TRANSACTION_MODE", "true").lower() == "true"
+)
+# The pooler multiplexes onto a few hot backends, so the client pool stays small;
+# the Flask dashboard and the poller share the same database.
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -58,6 +71,107 @@ intents.guilds = True
 intents.members = True
 intents.voice_states = True
 
+# ==========================
+# SQL Statements
+# ==========================
+SQL_BOT_STATS_INC = """
+    INSERT INTO public.bot_stats (bot_id, commands_used) VALUES ($1, 1)
+    ON CONFLICT (bot_id) DO UPDATE SET
+    commands_used = public.bot_stats.commands_used + 1,
+    last_updated = NOW();
+"""
+
+SQL_BOT_STATS_UPSERT = """
+    INSERT INTO public.bot_stats (bot_id, server_count, user_count, last_updated)
+    VALUES ($1, $2, $3, NOW())
+    ON CONFLICT (bot_id) DO UPDATE SET
+        server_count = $2,
+        user_count = $3,
+        last_updated = NOW()
+"""
+
+SQL_BOT_STATS_UPSERT_RETURNING = SQL_BOT_STATS_UPSERT + "    RETURNING *\n"
+
+SQL_BOT_STATS_INIT = """
+    INSERT INTO public.bot_stats (bot_id, server_count, user_count, commands_used, last_updated)
+    VALUES ($1, $2, $3, 0, NOW())
+    ON CONFLICT (bot_id) DO NOTHING
+"""
+
+SQL_GUILD_UPSERT = (
+    "INSERT INTO public.guild_settings (guild_id) VALUES ($1) "
+    "ON CONFLICT (guild_id) DO NOTHING"
+)
+
+# Per-guild tables cleared when the bot leaves a guild, dependents first.
+GUILD_DATA_TABLES = (
+    # Leveling
+    "users",
+    "level_roles",
+    "level_notify_channel",
+    "auto_reset",
+    "level_system_config",
+    "last_notified_level",
+    # YouTube configs and logs
+    "youtube_notification_config",
+    "youtube_notification_logs",
+    # Time and restriction configs
+    "server_time_configs",
+    "channel_restrictions_v2",
+    "bypass_roles",
+    # Reminders and stats
+    "reminders",
+    "guild_stats",
+    # Join-to-Create (voice_temp_channels will cascade delete)
+    "join_to_create_config",
+    # Finally the guild itself
+    "guild_settings",
+)
+
+# Concurrent `bot.db()` users allowed before new requests are rejected (2x pool max_size).
+DB_GATE_LIMIT = int(os.getenv("DB_GATE_LIMIT", str(2 * DB_POOL_MAX_SIZE)))
+
+
+def _pool_saturated(pool) -> bool:
+    """
+    True when every pooled connection is checked out and the pool cannot grow.
+
+    Reads the pool itself, so manager queries that use `pool` directly count
+    towards the load, not only `bot.db()` callers.
+    """
+    return pool.get_idle_size() == 0 and pool.get_size() >= pool.get_max_size()
+
+
+class DatabaseBusyError(Exception):
+    """
+    Raised by `SupporterBot.db()` when every database slot is already taken.
+
+    Surfaced to users as a "busy" message instead of queueing behind a
+    stalled connection pool.
+    """
+
+
+class SupporterConnection(asyncpg.Connection):
+    """
+    asyncpg connection that carries statements prepared once per session.
+    """
+
+    delete_stmts = None
+
+    async def get_delete_stmts(self):
+        """
+        Prepare the guild cleanup DELETEs on first use and keep them for this session.
+
+        Lazy so a missing table never fails pool creation and connections that
+        never see a guild removal skip the extra round-trips.
+        """
+        if self.delete_stmts is None:
+            self.delete_stmts = [
+                await self.prepare(f"DELETE FROM public.{table} WHERE guild_id = $1")
+                for table in GUILD_DATA_TABLES
+            ]
+        return self.delete_stmts
+
 
 class SupporterCommandTree(discord.app_commands.CommandTree):
     """
@@ -67,12 +181,24 @@ class SupporterCommandTree(discord.app_commands.CommandTree):
     global counter stored in the `bot_stats` table.
     """
 
+    # Bound once in `on_ready` so the per-command path avoids walking
+    # `interaction.client` for the pool and bot id.
+    _pool = None
+    _bot_id_str = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Strong references to in-flight counter writes so they are not GC'd.
+        self._pending_writes: set = set()
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """
         Global pre-command check for all application commands.
 
-        When a command is invoked, this method increments the `commands_used`
-        field for the current bot in the `bot_stats` table.
+        When a command is invoked, this method schedules an increment of the
+        `commands_used` field for the current bot in the `bot_stats` table.
+        The write runs as a background task so command latency never waits
+        on the database.
 
         Parameters
         ----------
@@ -85,25 +211,30 @@ class SupporterCommandTree(discord.app_commands.CommandTree):
             Always returns True to allow the command to proceed.
         """
         if interaction.command is not None:
-            bot_instance = interaction.client
-            if bot_instance.pool:
-                try:
-                    await bot_instance.pool.execute(
-                        """
-                        INSERT INTO public.bot_stats (bot_id, commands_used) VALUES ($1, 1)
-                        ON CONFLICT (bot_id) DO UPDATE SET
-                        commands_used = public.bot_stats.commands_used + 1,
-                        last_updated = NOW();
-                        """,
-                        str(bot_instance.user.id),
-                    )
-                    log.info(
-                        f"📊 Command used: /{interaction.command.name} by {interaction.user}. DB counter incremented."
-                    )
-                except Exception as e:
-                    log.error(f"Failed to increment command counter in DB: {e}")
+            # Skip the usage counter until on_ready or while the pool is saturated.
+            if self._pool is not None and not _pool_saturated(self._pool):
+                task = asyncio.create_task(self._record_command(interaction))
+                self._pending_writes.add(task)
+                task.add_done_callback(self._pending_writes.discard)
         return True
 
+    async def _record_command(self, interaction: discord.Interaction):
+        """
+        Increment the global `commands_used` counter for one invocation.
+
+        Runs detached from `interaction_check`, so all errors are logged here
+        instead of propagating to the command.
+        """
+        try:
+            await self._pool.execute(SQL_BOT_STATS_INC, self._bot_id_str)
+            log.info(
+                "📊 Command used: /%s by %s. DB counter incremented.",
+                interaction.command.name,
+                interaction.user,
+            )
+        except Exception as e:
+            log.error("Failed to increment command counter in DB: %s", e)
+
 
 class SupporterBot(commands.Bot):
     """
@@ -129,6 +260,46 @@ class SupporterBot(commands.Bot):
             tree_cls=SupporterCommandTree,
         )
         self.pool = None
+        self._db_gate = asyncio.Semaphore(DB_GATE_LIMIT)
+
+        # Feature managers are created in setup_hook; None until then.
+        self.datetime_manager = None
+        self.notext_manager = None
+        self.help_manager = None
+        self.owner_manager = None
+        self.level_manager = None
+        self.youtube_manager = None
+        self.reminder_manager = None
+        self.analytics_manager = None
+        self.ticket_system = None
+        self.join_to_create_manager = None
+
+    @contextlib.asynccontextmanager
+    async def db(self, wait: bool = False):
+        """
+        Acquire a pooled connection behind a bounded gate.
+
+        Fails fast with `DatabaseBusyError` when the pool has no free
+        connection left (whoever holds them) or `DB_GATE_LIMIT` callers are
+        already holding or waiting for one, so handlers do not pile up
+        behind a stalled database.
+
+        Parameters
+        ----------
+        wait : bool
+            Queue on the gate instead of failing fast. Used by gateway event
+            handlers, whose writes must not be dropped under load.
+
+        Yields
+        ------
+        asyncpg.Connection
+            A connection checked out from `self.pool`.
+        """
+        if not wait and (self._db_gate.locked() or _pool_saturated(self.pool)):
+            raise DatabaseBusyError("Database connection limit reached.")
+        async with self._db_gate:
+            async with self.pool.acquire() as conn:
+                yield conn
 
     async def close(self):
         """
@@ -142,25 +313,46 @@ class SupporterBot(commands.Bot):
         """
         log.info("🛑 Shutting down feature managers...")
 
-        if hasattr(self, "datetime_manager"):
-            self.datetime_manager.stop()
-        if hasattr(self, "reminder_manager"):
-            self.reminder_manager.stop()
-        if hasattr(self, "level_manager"):
-            self.level_manager.stop()
-        if hasattr(self, "youtube_manager"):
-            await self.youtube_manager.stop()
-        if hasattr(self, "analytics_manager"):
-            self.analytics_manager.stop()
-        if hasattr(self, "ticket_system"):
-            self.ticket_system.stop()
-        if hasattr(self, "join_to_create_manager"):
-            await self.join_to_create_manager.stop()
-
-        if hasattr(self, "update_stats_task") and self.update_stats_task.is_running():
+        managers = [
+            m
+            for m in (
+                self.datetime_manager,
+                self.reminder_manager,
+                self.level_manager,
+                self.youtube_manager,
+                self.analytics_manager,
+                self.ticket_system,
+                self.join_to_create_manager,
+            )
+            if m is not None
+        ]
+
+        # Synchronous stops just cancel loops; async ones are awaited together.
+        async_stops = []
+        for manager in managers:
+            if asyncio.iscoroutinefunction(manager.stop):
+                async_stops.append(manager.stop())
+            else:
+                manager.stop()
+        if async_stops:
+            await asyncio.gather(*async_stops, return_exceptions=True)
+
+        if self.update_stats_task.is_running():
             self.update_stats_task.cancel()
 
-        await asyncio.sleep(0.25)
+        # Wait for the cancelled loops to actually unwind before closing the pool.
+        pending = [task for m in managers for task in m.background_tasks]
+        stats_task = self.update_stats_task.get_task()
+        if stats_task is not None:
+            pending.append(stats_task)
+
+        if pending:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*pending, return_exceptions=True), timeout=5.0
+                )
+            except asyncio.TimeoutError:
+                log.warning("⚠️ Background tasks did not finish within 5s.")
 
         if self.pool:
             try:
@@ -169,7 +361,7 @@ class SupporterBot(commands.Bot):
             except asyncio.TimeoutError:
                 log.warning("⚠️ Database pool closure timed out.")
             except Exception as e:
-                log.error(f"⚠️ Error closing database pool: {e}")
+                log.error("⚠️ Error closing database pool: %s", e)
 
         await super().close()
 
@@ -190,25 +382,45 @@ class SupporterBot(commands.Bot):
         try:
             self.pool = await asyncpg.create_pool(
                 DATABASE_URL,
-                min_size=5,
-                max_size=20,
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
                 max_inactive_connection_lifetime=300,
                 command_timeout=60,
                 max_queries=50000,
-                statement_cache_size=0,
+                # asyncpg's per-connection statement cache (default 100) skips re-parsing
+                # the managers' fixed $n-parameterised queries; it has to stay off behind
+                # a transaction-mode pooler, where a cached statement may live on another backend.
+                statement_cache_size=0 if PGBOUNCER_TRANSACTION_MODE else DB_STATEMENT_CACHE_SIZE,
+                connection_class=SupporterConnection,
             )
             log.info("✅ Successfully connected to the PostgreSQL database.")
-            log.info(f"   Pool settings: min=5, max=20, timeout=60s")
-            log.info(f"   Connection mode: Transaction (port 6543)")
-            log.info(f"   ⚡ Statement cache: DISABLED (pgbouncer compatible)")
+            log.info(
+                "   Pool settings: min=%s, max=%s, timeout=60s", DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE
+            )
+            if PGBOUNCER_TRANSACTION_MODE:
+                log.info("   Connection mode: Transaction (port 6543)")
+                log.info("   ⚡ Statement cache: DISABLED (pgbouncer compatible)")
+            else:
+                log.info("   Connection mode: Direct / session")
+                log.info(
+                    "   ⚡ Statement cache: ENABLED (%s per connection)", DB_STATEMENT_CACHE_SIZE
+                )
         except Exception as e:
-            log.critical(f"❌ CRITICAL: Could not connect to the database: {e}")
+            log.critical("❌ CRITICAL: Could not connect to the database: %s", e)
             log.critical(
                 "   Make sure you're using port 6543 (Transaction mode) not 5432 (Session mode)!"
             )
             await self.close()
             return
 
+        # --- Schema Extensions ---
+        try:
+            await self.pool.execute(
+                "ALTER TABLE public.bot_stats ADD COLUMN IF NOT EXISTS commands_hash TEXT"
+            )
+        except Exception as e:
+            log.error("⚠️ Could not ensure bot_stats.commands_hash column: %s", e)
+
         # --- Initialize Feature Managers ---
         log.info("Initializing feature managers...")
         self.datetime_manager = DateTimeManager(self, self.pool)
@@ -229,6 +441,7 @@ class SupporterBot(commands.Bot):
         await self.youtube_manager.start()
         await self.reminder_manager.start()
         await self.analytics_manager.start()
+        await self.ticket_system.start()
         await self.join_to_create_manager.start()
         
         # --- Link Join-to-Create with LevelManager for XP integration ---
@@ -251,62 +464,53 @@ class SupporterBot(commands.Bot):
 
         log.info("All managers have been initialized.")
 
-    async def update_stats_once(self) -> bool:
+    def _current_totals(self) -> tuple:
+        """
+        Return `(server_count, user_count)` from the guild cache.
+
+        Guilds with an unknown (`None`) member count contribute zero users.
+        """
+        guilds = self.guilds
+        return len(guilds), sum(g.member_count or 0 for g in guilds)
+
+    async def update_stats_once(self):
         """
         Perform a single update of server and user counts in the database.
 
         Returns
         -------
-        bool
-            True if the update was successful and verified, otherwise False.
+        asyncpg.Record | None
+            The updated `bot_stats` row (via RETURNING) on success, otherwise None.
         """
         if self.pool is None or not self.is_ready():
-            return False
+            return None
 
-        server_count = len(self.guilds)
-        user_count = sum(
-            guild.member_count for guild in self.guilds if guild.member_count
-        )
+        server_count, user_count = self._current_totals()
 
         log.info("=" * 60)
         log.info("📊 STATS UPDATE TRIGGERED")
-        log.info(f"   Servers: {server_count}")
-        log.info(f"   Users: {user_count}")
+        log.info("   Servers: %s", server_count)
+        log.info("   Users: %s", user_count)
         log.info("=" * 60)
 
-        query = """
-            INSERT INTO public.bot_stats (bot_id, server_count, user_count, last_updated)
-            VALUES ($1, $2, $3, NOW())
-            ON CONFLICT (bot_id) DO UPDATE SET
-                server_count = $2,
-                user_count = $3,
-                last_updated = NOW();
-        """
         try:
-            await self.pool.execute(
-                query,
+            row = await self.pool.fetchrow(
+                SQL_BOT_STATS_UPSERT_RETURNING,
                 str(self.user.id),
                 server_count,
                 user_count,
             )
-            log.info("✅ Server/User stats successfully written to database")
-
-            verify = await self.pool.fetchrow(
-                "SELECT * FROM public.bot_stats WHERE bot_id = $1", str(self.user.id)
+            log.info(
+                "✅ Stats written: DB now shows %s servers, %s users, %s total commands",
+                row["server_count"],
+                row["user_count"],
+                row["commands_used"],
             )
-            if verify:
-                log.info(
-                    f"✅ Verification: DB now shows {verify['server_count']} servers, "
-                    f"{verify['user_count']} users, {verify['commands_used']} total commands"
-                )
-            else:
-                log.error("❌ Verification failed: No row found in database!")
-
-            return True
+            return row
 
         except Exception as e:
-            log.error(f"❌ Failed to update bot stats in DB: {e}", exc_info=True)
-            return False
+            log.error("❌ Failed to update bot stats in DB: %s", e, exc_info=True)
+            return None
 
     @tasks.loop(minutes=5)
     async def update_stats_task(self):
@@ -321,26 +525,18 @@ class SupporterBot(commands.Bot):
         if not self.pool:
             return
 
-        server_count = len(self.guilds)
-        user_count = sum(g.member_count for g in self.guilds if g.member_count)
+        server_count, user_count = self._current_totals()
 
         try:
             await self.pool.execute(
-                """
-                INSERT INTO public.bot_stats (bot_id, server_count, user_count, last_updated)
-                VALUES ($1, $2, $3, NOW())
-                ON CONFLICT (bot_id) DO UPDATE SET
-                    server_count = $2,
-                    user_count = $3,
-                    last_updated = NOW();
-                """,
+                SQL_BOT_STATS_UPSERT,
                 str(self.user.id),
                 server_count,
                 user_count,
             )
-            log.info(f"📊 Stats Updated: {server_count} Servers, {user_count} Users")
+            log.info("📊 Stats Updated: %s Servers, %s Users", server_count, user_count)
         except Exception as e:
-            log.error(f"Stats Update Error: {e}")
+            log.error("Stats Update Error: %s", e)
 
     @update_stats_task.before_loop
     async def before_stats(self):
@@ -370,39 +566,35 @@ async def on_ready():
     ----------------
     - Initialize or verify the `bot_stats` row for this bot.
     - Synchronize the current guild list with the database.
-    - Sync global application commands (slash commands).
+    - Sync global application commands (slash commands) if they changed.
     - Log basic connection and guild information.
     """
     log.info("=" * 50)
-    log.info(f"✅ Logged in as {bot.user} (ID: {bot.user.id})")
+    log.info("✅ Logged in as %s (ID: %s)", bot.user, bot.user.id)
+
+    SupporterCommandTree._bot_id_str = str(bot.user.id)
+    SupporterCommandTree._pool = bot.pool
 
     if bot.pool:
         try:
-            await bot.pool.execute(
-                """
-                INSERT INTO public.bot_stats (bot_id, server_count, user_count, commands_used, last_updated)
-                VALUES ($1, $2, $3, 0, NOW())
-                ON CONFLICT (bot_id) DO NOTHING
-                """,
-                str(bot.user.id),
-                len(bot.guilds),
-                sum(g.member_count for g in bot.guilds if g.member_count),
-            )
-            log.info("✅ Verified bot_stats table entry.")
+            async with bot.db(wait=True) as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        SQL_BOT_STATS_INIT, str(bot.user.id), *bot._current_totals()
+                    )
+                    log.info("✅ Verified bot_stats table entry.")
+                    await sync_all_guilds_to_database(conn)
         except Exception as e:
-            log.error(f"⚠️ Error initializing/verifying bot_stats: {e}")
+            log.error("⚠️ Error initializing bot_stats / syncing guilds: %s", e)
+    else:
+        log.error("Cannot sync guilds: Database pool not initialized")
 
-    await sync_all_guilds_to_database()
+    await sync_command_tree()
 
-    try:
-        synced = await bot.tree.sync()
-        log.info(f"✅ Synced {len(synced)} slash commands globally.")
-    except Exception as e:
-        log.error(f"❌ Failed to sync slash commands: {e}")
-
-    log.info(f"🚀 Bot is connected to {len(bot.guilds)} server(s):")
-    for guild in bot.guilds:
-        log.info(f"   - {guild.name} (ID: {guild.id})")
+    log.info("🚀 Bot is connected to %s server(s):", len(bot.guilds))
+    if log.isEnabledFor(logging.INFO):
+        for guild in bot.guilds:
+            log.info("   - %s (ID: %s)", guild.name, guild.id)
     log.info("=" * 50)
     log.info("✅ Bot is fully ready and operational!")
 
@@ -416,10 +608,10 @@ async def on_guild_join(guild: discord.Guild):
     - Checks whether the guild is banned and leaves if necessary.
     - Registers the guild in the `guild_settings` table if allowed.
     """
-    log.info(f"🔥 Joined a new server: {guild.name} (ID: {guild.id})")
+    log.info("🔥 Joined a new server: %s (ID: %s)", guild.name, guild.id)
 
     if await bot.owner_manager.is_guild_banned(guild.id):
-        log.warning(f"🚫 Bot joined banned server {guild.name}. Leaving immediately.")
+        log.warning("🚫 Bot joined banned server %s. Leaving immediately.", guild.name)
         try:
             if guild.owner:
                 await guild.owner.send(
@@ -432,16 +624,11 @@ async def on_guild_join(guild: discord.Guild):
             return
 
     try:
-        async with bot.pool.acquire() as conn:
-            await conn.execute(
-                """INSERT INTO public.guild_settings (guild_id) 
-                   VALUES ($1) 
-                   ON CONFLICT (guild_id) DO NOTHING""",
-                str(guild.id),
-            )
-        log.info(f"✅ Registered guild {guild.name} in database")
+        async with bot.db(wait=True) as conn:
+            await conn.execute(SQL_GUILD_UPSERT, str(guild.id))
+        log.info("✅ Registered guild %s in database", guild.name)
     except Exception as e:
-        log.error(f"Error registering guild in database: {e}")
+        log.error("Error registering guild in database: %s", e)
 
 
 @bot.event
@@ -452,44 +639,33 @@ async def on_guild_remove(guild: discord.Guild):
     This will de-register the guild from `guild_settings` and clean up
     all associated data to keep the database consistent.
     """
-    log.info(f"👋 Left server: {guild.name} (ID: {guild.id})")
+    log.info("👋 Left server: %s (ID: %s)", guild.name, guild.id)
 
+    guild_id = str(guild.id)
     try:
-        async with bot.pool.acquire() as conn:
+        async with bot.db(wait=True) as conn:
+            # Prepared statements only outside transaction pooling (see PGBOUNCER_TRANSACTION_MODE)
+            delete_stmts = None
+            if not PGBOUNCER_TRANSACTION_MODE:
+                try:
+                    delete_stmts = await conn.get_delete_stmts()
+                except Exception as e:
+                    log.warning(
+                        "Could not prepare guild cleanup statements, using plain DELETEs: %s", e
+                    )
             async with conn.transaction():
-                # Delete from dependent tables first
-                await conn.execute("DELETE FROM public.users WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.level_roles WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.level_notify_channel WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.auto_reset WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.level_system_config WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.last_notified_level WHERE guild_id = $1", str(guild.id))
-                
-                # Delete YouTube configs and logs
-                await conn.execute("DELETE FROM public.youtube_notification_config WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.youtube_notification_logs WHERE guild_id = $1", str(guild.id))
-                
-                # Delete time and restriction configs
-                await conn.execute("DELETE FROM public.server_time_configs WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.channel_restrictions_v2 WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.bypass_roles WHERE guild_id = $1", str(guild.id))
-                
-                # Delete reminders and stats
-                await conn.execute("DELETE FROM public.reminders WHERE guild_id = $1", str(guild.id))
-                await conn.execute("DELETE FROM public.guild_stats WHERE guild_id = $1", str(guild.id))
-                
-                # Delete Join-to-Create data (voice_temp_channels will cascade delete)
-                await conn.execute("DELETE FROM public.join_to_create_config WHERE guild_id = $1", str(guild.id))
-                
-                # Finally delete from guild_settings
-                await conn.execute(
-                    "DELETE FROM public.guild_settings WHERE guild_id = $1",
-                    str(guild.id),
-                )
-                
-        log.info(f"🗑️ De-registered guild {guild.name} and cleaned up all data.")
+                if delete_stmts:
+                    for stmt in delete_stmts:
+                        await stmt.fetchval(guild_id)
+                else:
+                    for table in GUILD_DATA_TABLES:
+                        await conn.execute(
+                            f"DELETE FROM public.{table} WHERE guild_id = $1", guild_id
+                        )
+
+        log.info("🗑️ De-registered guild %s and cleaned up all data.", guild.name)
     except Exception as e:
-        log.error(f"Error de-registering guild from database: {e}")
+        log.error("Error de-registering guild from database: %s", e)
 
 
 # ==========================
@@ -497,50 +673,109 @@ async def on_guild_remove(guild: discord.Guild):
 # ==========================
 
 
-async def sync_all_guilds_to_database():
+async def sync_all_guilds_to_database(conn):
     """
     Synchronize the current guild list with the `guild_settings` table.
 
     Ensures that:
     - All guilds the bot is currently in are present in the database.
     - Any guilds that no longer contain the bot are removed from the database.
-    """
-    if not bot.pool:
-        log.error("Cannot sync guilds: Database pool not initialized")
-        return
 
-    log.info(f"🔄 Syncing {len(bot.guilds)} guilds to database...")
+    Parameters
+    ----------
+    conn : asyncpg.Connection
+        Connection to run on; the caller owns any surrounding transaction.
+    """
+    log.info("🔄 Syncing %s guilds to database...", len(bot.guilds))
 
     current_guild_ids = {str(g.id) for g in bot.guilds}
 
-    async with bot.pool.acquire() as conn:
-        db_guild_ids = {
-            row["guild_id"]
-            for row in await conn.fetch("SELECT guild_id FROM public.guild_settings")
-        }
+    db_guild_ids = {
+        row["guild_id"]
+        for row in await conn.fetch("SELECT guild_id FROM public.guild_settings")
+    }
 
-        guilds_to_add = current_guild_ids - db_guild_ids
-        guilds_to_remove = db_guild_ids - current_guild_ids
+    guilds_to_add = current_guild_ids - db_guild_ids
+    guilds_to_remove = db_guild_ids - current_guild_ids
 
-        if guilds_to_add:
-            log.info(f"Found {len(guilds_to_add)} new guilds to register.")
-            await conn.executemany(
-                "INSERT INTO public.guild_settings (guild_id) VALUES ($1) ON CONFLICT (guild_id) DO NOTHING",
-                [(gid,) for gid in guilds_to_add],
-            )
+    if guilds_to_add:
+        log.info("Found %s new guilds to register.", len(guilds_to_add))
+        await conn.executemany(
+            SQL_GUILD_UPSERT,
+            [(gid,) for gid in guilds_to_add],
+        )
 
-        if guilds_to_remove:
-            log.warning(
-                f"Found {len(guilds_to_remove)} guilds to de-register (bot was removed)."
-            )
-            await conn.execute(
-                "DELETE FROM public.guild_settings WHERE guild_id = ANY($1::TEXT[])",
-                list(guilds_to_remove),
-            )
+    if guilds_to_remove:
+        log.warning(
+            "Found %s guilds to de-register (bot was removed).",
+            len(guilds_to_remove),
+        )
+        await conn.execute(
+            "DELETE FROM public.guild_settings WHERE guild_id = ANY($1::TEXT[])",
+            list(guilds_to_remove),
+        )
 
     log.info("✅ Guild sync complete.")
 
 
+def _command_tree_hash() -> str:
+    """
+    Return a stable SHA-256 of the registered global application commands.
+    """
+    payload = []
+    for command in bot.tree.get_commands():
+        try:
+            payload.append(command.to_dict(bot.tree))
+        except TypeError:
+            # discord.py < 2.4 takes no tree argument
+            payload.append(command.to_dict())
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+async def sync_command_tree():
+    """
+    Sync global slash commands only when the registered set has changed.
+
+    The hash of the last synced command tree is stored in
+    `bot_stats.commands_hash`, so reconnects skip the Discord REST call
+    unless the code registering commands differs.
+    """
+    bot_id = str(bot.user.id)
+    commands_hash = _command_tree_hash()
+
+    if bot.pool:
+        try:
+            stored_hash = await bot.pool.fetchval(
+                "SELECT commands_hash FROM public.bot_stats WHERE bot_id = $1",
+                bot_id,
+            )
+        except Exception as e:
+            log.error("⚠️ Could not read stored command hash: %s", e)
+            stored_hash = None
+
+        if stored_hash == commands_hash:
+            log.info("✅ Slash commands unchanged; skipping global sync.")
+            return
+
+    try:
+        synced = await bot.tree.sync()
+        log.info("✅ Synced %s slash commands globally.", len(synced))
+    except Exception as e:
+        log.error("❌ Failed to sync slash commands: %s", e)
+        return
+
+    if bot.pool:
+        try:
+            await bot.pool.execute(
+                "UPDATE public.bot_stats SET commands_hash = $2 WHERE bot_id = $1",
+                bot_id,
+                commands_hash,
+            )
+        except Exception as e:
+            log.error("⚠️ Could not store command hash: %s", e)
+
+
 # ==========================
 # Global Slash Commands
 # ==========================
@@ -567,8 +802,7 @@ async def ping(interaction: discord.Interaction):
         user_count = stats["user_count"]
         commands_used = stats["commands_used"]
     else:
-        server_count = len(bot.guilds)
-        user_count = sum(guild.member_count for guild in bot.guilds)
+        server_count, user_count = bot._current_totals()
         commands_used = 0
 
     embed = discord.Embed(
@@ -598,41 +832,32 @@ async def force_stats_update(interaction: discord.Interaction):
     This command is restricted to the bot owner and triggers a one-time
     refresh of server and user counts using `update_stats_once()`.
     """
+    await interaction.response.defer(ephemeral=True)
+
     if not await bot.is_owner(interaction.user):
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "❌ This command is only for the bot owner.", ephemeral=True
         )
         return
 
-    await interaction.response.defer(ephemeral=True)
-
-    updated = await bot.update_stats_once()
-    if not updated:
+    updated_stats = await bot.update_stats_once()
+    if updated_stats is None:
         await interaction.followup.send(
             "⚠️ Could not update stats. Ensure the bot is ready and the database is reachable.",
             ephemeral=True,
         )
         return
 
-    updated_stats = await bot.pool.fetchrow(
-        "SELECT * FROM public.bot_stats WHERE bot_id = $1", str(bot.user.id)
+    embed = discord.Embed(
+        title="✅ Stats Force Updated!",
+        color=discord.Color.green(),
     )
-
-    if updated_stats:
-        embed = discord.Embed(
-            title="✅ Stats Force Updated!",
-            color=discord.Color.green(),
-        )
-        embed.add_field(name="Servers", value=str(updated_stats["server_count"]))
-        embed.add_field(name="Users", value=str(updated_stats["user_count"]))
-        embed.add_field(name="Commands Used", value=str(updated_stats["commands_used"]))
-        embed.set_footer(text="Database updated successfully!")
-        await interaction.followup.send(embed=embed, ephemeral=True)
-        log.info(f"🔄 Stats manually updated by {interaction.user}")
-    else:
-        await interaction.followup.send(
-            "❌ Error updating stats: Could not verify the update.", ephemeral=True
-        )
+    embed.add_field(name="Servers", value=str(updated_stats["server_count"]))
+    embed.add_field(name="Users", value=str(updated_stats["user_count"]))
+    embed.add_field(name="Commands Used", value=str(updated_stats["commands_used"]))
+    embed.set_footer(text="Database updated successfully!")
+    await interaction.followup.send(embed=embed, ephemeral=True)
+    log.info("🔄 Stats manually updated by %s", interaction.user)
 
 
 @bot.tree.command(
@@ -661,7 +886,7 @@ async def show_config(interaction: discord.Interaction):
     )
     embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
 
-    async with bot.pool.acquire() as conn:
+    async with bot.db() as conn:
         # --- Fetch Configuration & Analytics Data ---
         level_notify_ch_id = await conn.fetchval(
             "SELECT channel_id FROM public.level_notify_channel WHERE guild_id = $1",
@@ -777,10 +1002,12 @@ async def on_app_command_error(
     and falls back to a generic message for unexpected errors.
     """
     command_name = interaction.command.name if interaction.command else "unknown"
-    log.error(f"Slash command error for '/{command_name}': {error}")
+    log.error("Slash command error for '/%s': %s", command_name, error)
 
     message = "❌ An unexpected error occurred. Please try again later."
-    if isinstance(error, discord.app_commands.MissingPermissions):
+    if isinstance(getattr(error, "original", None), DatabaseBusyError):
+        message = "⏳ The bot is busy right now. Please try again in a few seconds."
+    elif isinstance(error, discord.app_commands.MissingPermissions):
         message = "🚫 You do not have the required permissions to run this command."
     elif isinstance(error, discord.app_commands.CheckFailure):
         message = "🚫 You are not allowed to use this command."
@@ -1,5 +1,6 @@
 # v5.0.0
 # v4.0.0
+import asyncio
 import discord
 from discord import app_commands, ui
 from discord.ext import commands, tasks
@@ -7,48 +8,99 @@ import asyncpg
 import logging
 from datetime import datetime, timedelta, timezone
 import io
+import time
 
 log = logging.getLogger(__name__)
 
+# Seconds a cached ticket_system_config row stays valid (also cleared on /tt1-setup)
+CONFIG_CACHE_TTL = 300
+# Open tickets with no messages for this long are auto-closed by the hourly sweep
+INACTIVITY_SECONDS = 6 * 3600
+# Max tickets whose history is fetched / channel deleted at once during the sweep
+INACTIVITY_CONCURRENCY = 10
+# Messages saved per ticket transcript
+TRANSCRIPT_HISTORY_LIMIT = 500
+# Upper bound (UTF-8 bytes) on a stored/uploaded transcript; longer ones are cut with a marker
+TRANSCRIPT_MAX_BYTES = 512 * 1024
+
+# $1 ticket_id, $2 guild_id, $3 opener_user_id, $4 voice_channel_id
+_INSERT_TICKET_SQL = """
+    INSERT INTO public.ticket_transcripts (ticket_id, guild_id, opener_user_id, status, closed_at, voice_channel_id)
+    VALUES ($1, $2, $3, 'open', NULL, $4)
+"""
+# Same insert, also closing the user's ghost ticket ($5) whose channel no longer exists
+_CLOSE_GHOST_AND_INSERT_TICKET_SQL = """
+    WITH cleanup AS (
+        UPDATE public.ticket_transcripts SET status = 'closed', closed_at = NOW()
+        WHERE ticket_id = $5 AND status = 'open'
+        RETURNING 1
+    )""" + _INSERT_TICKET_SQL
+
+def _render_transcript(messages) -> str:
+    """Render ticket messages (oldest first) as plain-text transcript lines.
+
+    Pure CPU work on already-fetched messages; callers run it via asyncio.to_thread.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    for msg in messages:
+        write(f"[{msg.created_at:%Y-%m-%d %H:%M:%S}] {msg.author.name}: {msg.content}\n")
+        for att in msg.attachments:
+            write(f"  [Attachment] {att.url}\n")
+    return buf.getvalue()
+
+def _cap_transcript(transcript_text: str) -> str:
+    """Cut a transcript to TRANSCRIPT_MAX_BYTES of UTF-8 without splitting a character."""
+    encoded = transcript_text.encode("utf-8")
+    if len(encoded) <= TRANSCRIPT_MAX_BYTES:
+        return transcript_text
+    # errors="ignore" drops a multibyte sequence the byte cut landed inside
+    return encoded[:TRANSCRIPT_MAX_BYTES].decode("utf-8", errors="ignore") + "\n...[truncated]"
+
+def _render_capped_transcript(messages) -> str:
+    return _cap_transcript(_render_transcript(messages))
+
+async def _build_transcript(channel: discord.TextChannel) -> str:
+    """Fetch up to TRANSCRIPT_HISTORY_LIMIT messages and render them off the event loop, capped at TRANSCRIPT_MAX_BYTES.
+
+    discord.py pages history 100 messages at a time and already stops on the
+    first short page, so a ticket with fewer messages costs a single request.
+    """
+    messages = [message async for message in channel.history(limit=TRANSCRIPT_HISTORY_LIMIT, oldest_first=True)]
+    return await asyncio.to_thread(_render_capped_transcript, messages)
+
 class TicketView(ui.View):
-    def __init__(self, bot, pool):
+    def __init__(self, system: "TicketSystem"):
         super().__init__(timeout=None)
-        self.bot = bot
-        self.pool = pool
+        self.system = system
+        self.bot = system.bot
+        self.pool = system.pool
 
     @ui.button(label="Open Ticket", style=discord.ButtonStyle.primary, custom_id="create_ticket_btn", emoji="📩")
     async def create_ticket(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer(ephemeral=True)
 
-        user_id = str(interaction.user.id)
-        guild_id = str(interaction.guild_id)
+        user_id = interaction.user.id
+        guild_id = interaction.guild_id
 
-        # Check configuration
-        config = await self.pool.fetchrow("SELECT * FROM public.ticket_system_config WHERE guild_id = $1", guild_id)
+        # Check configuration and any existing open ticket in one round-trip
+        config, existing = await self.system.get_config_and_open_ticket(guild_id, user_id)
         if not config:
             await interaction.followup.send("Ticket system is not configured for this server.", ephemeral=True)
             return
 
-        category_id = config['ticket_category_id']
-        category = interaction.guild.get_channel(int(category_id)) if category_id else None
+        category, admin_role = self.system.resolve_targets(interaction.guild, config)
 
         if not category:
             await interaction.followup.send("Ticket category not found. Please contact admin.", ephemeral=True)
             return
 
-        # Check existing open tickets for user
-        existing = await self.pool.fetchval(
-            "SELECT ticket_id FROM public.ticket_transcripts WHERE guild_id = $1 AND opener_user_id = $2 AND status = 'open'",
-            guild_id, user_id
-        )
         if existing:
-            channel = interaction.guild.get_channel(int(existing))
+            channel = interaction.guild.get_channel(existing)
             if channel:
                 await interaction.followup.send(f"You already have an open ticket: {channel.mention}", ephemeral=True)
                 return
-            else:
-                # Cleanup ghost ticket
-                await self.pool.execute("UPDATE public.ticket_transcripts SET status = 'closed', closed_at = NOW() WHERE ticket_id = $1", existing)
+            # Otherwise it's a ghost ticket; it gets closed together with the INSERT below
 
         # Create channel
         overwrites = {
@@ -57,36 +109,35 @@ class TicketView(ui.View):
             interaction.guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_channels=True)
         }
         
-        if config['admin_role_id']:
-            admin_role = interaction.guild.get_role(int(config['admin_role_id']))
-            if admin_role:
-                overwrites[admin_role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+        if admin_role:
+            overwrites[admin_role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
 
-        try:
-            channel_name = f"ticket-{interaction.user.name}"
-            # Create text channel
-            ticket_channel = await interaction.guild.create_text_channel(
-                name=channel_name,
-                category=category,
-                overwrites=overwrites
-            )
-            
-            # Create voice channel
-            voice_channel = await interaction.guild.create_voice_channel(
-                name=f"🎙️-{channel_name}",
-                category=category,
-                overwrites=overwrites
-            )
-        except Exception as e:
-            await interaction.followup.send(f"Failed to create ticket channels: {e}", ephemeral=True)
+        # Create text and voice channels concurrently
+        channel_name = f"ticket-{interaction.user.name}"
+        results = await asyncio.gather(
+            interaction.guild.create_text_channel(name=channel_name, category=category, overwrites=overwrites),
+            interaction.guild.create_voice_channel(name=f"🎙️-{channel_name}", category=category, overwrites=overwrites),
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Don't leave half a ticket behind
+            for created in results:
+                if not isinstance(created, BaseException):
+                    try:
+                        await created.delete(reason="Ticket creation failed")
+                    except Exception as e:
+                        log.error(f"Failed to clean up ticket channel: {e}")
+            await interaction.followup.send(f"Failed to create ticket channels: {errors[0]}", ephemeral=True)
             return
+        ticket_channel, voice_channel = results
 
-        # Log to DB
-        await self.pool.execute(
-            """INSERT INTO public.ticket_transcripts (ticket_id, guild_id, opener_user_id, status, closed_at) 
-               VALUES ($1, $2, $3, 'open', NULL)""",
-            str(ticket_channel.id), guild_id, user_id
-        )
+        # Log to DB (closing any ghost ticket in the same statement)
+        args = (ticket_channel.id, guild_id, user_id, voice_channel.id)
+        if existing:
+            await self.pool.execute(_CLOSE_GHOST_AND_INSERT_TICKET_SQL, *args, existing)
+        else:
+            await self.pool.execute(_INSERT_TICKET_SQL, *args)
 
         # Get custom welcome message from config or use default
         welcome_message = config.get('welcome_message') or f"Hello {{user}}, support will be with you shortly. Please describe your issue and we'll help you as soon as possible."
@@ -104,98 +155,229 @@ class TicketView(ui.View):
         embed.add_field(name="Voice Channel", value=voice_channel.mention, inline=False)
         embed.add_field(name="Actions", value="Click the button below to close this ticket when resolved.", inline=False)
         
-        view = CloseTicketView(self.bot, self.pool)
-        await ticket_channel.send(embed=embed, view=view)
+        await ticket_channel.send(embed=embed, view=self.system.close_view)
 
         await interaction.followup.send(f"Ticket created: {ticket_channel.mention} | Voice: {voice_channel.mention}", ephemeral=True)
 
 
 class CloseTicketView(ui.View):
-    def __init__(self, bot, pool):
+    def __init__(self, system: "TicketSystem"):
         super().__init__(timeout=None)
-        self.bot = bot
-        self.pool = pool
+        self.system = system
+        self.bot = system.bot
+        self.pool = system.pool
 
     @ui.button(label="Close Ticket", style=discord.ButtonStyle.danger, custom_id="close_ticket_btn", emoji="🔒")
     async def close_ticket(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.send_message("Are you sure you want to close this ticket?", view=ConfirmCloseView(self.bot, self.pool), ephemeral=True)
+        await interaction.response.send_message("Are you sure you want to close this ticket?", view=ConfirmCloseView(self.system), ephemeral=True)
 
 
 class ConfirmCloseView(ui.View):
-    def __init__(self, bot, pool):
+    def __init__(self, system: "TicketSystem"):
         super().__init__(timeout=60)
-        self.bot = bot
-        self.pool = pool
+        self.system = system
+        self.bot = system.bot
+        self.pool = system.pool
 
     @ui.button(label="Confirm Close", style=discord.ButtonStyle.danger, emoji="✅")
     async def confirm(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer()
-        ticket_id = str(interaction.channel.id)
+        ticket_id = interaction.channel.id
         
         # Save Transcript
-        messages = [message async for message in interaction.channel.history(limit=500, oldest_first=True)]
-        transcript_lines = []
-        for msg in messages:
-            timestamp = msg.created_at.strftime("%Y-%m-%d %H:%M:%S")
-            transcript_lines.append(f"[{timestamp}] {msg.author.name}: {msg.content}")
-            for att in msg.attachments:
-                transcript_lines.append(f"  [Attachment] {att.url}")
-        
-        transcript_text = "\n".join(transcript_lines)
+        transcript_text = await _build_transcript(interaction.channel)
         
-        # Update DB
-        await self.pool.execute(
+        # Update DB and get the paired voice channel back in the same round-trip
+        voice_channel_id = await self.pool.fetchval(
             """UPDATE public.ticket_transcripts 
                SET status = 'closed', closed_at = NOW(), closer_user_id = $1, transcript_text = $2
-               WHERE ticket_id = $3""",
-            str(interaction.user.id), transcript_text, ticket_id
+               WHERE ticket_id = $3
+               RETURNING voice_channel_id""",
+            interaction.user.id, transcript_text, ticket_id
         )
 
-        # Find and delete associated voice channel
-        category = interaction.channel.category
-        if category:
-            voice_channel_name = f"🎙️-{interaction.channel.name}"
-            for channel in category.voice_channels:
-                if channel.name == voice_channel_name:
-                    try:
-                        await channel.delete(reason="Ticket closed")
-                    except Exception as e:
-                        log.error(f"Failed to delete voice channel: {e}")
-                    break
+        # Find associated voice channel
+        if voice_channel_id:
+            voice_channel = interaction.guild.get_channel(voice_channel_id)
+        else:
+            # Tickets opened before voice_channel_id was stored: fall back to the name lookup
+            category = interaction.channel.category
+            voice_channel = discord.utils.get(category.voice_channels, name=f"🎙️-{interaction.channel.name}") if category else None
 
-        await interaction.channel.delete()
+        # Delete both channels concurrently
+        deletions = [interaction.channel.delete(reason="Ticket closed")]
+        if voice_channel:
+            deletions.append(voice_channel.delete(reason="Ticket closed"))
+        for result in await asyncio.gather(*deletions, return_exceptions=True):
+            if isinstance(result, Exception):
+                log.error(f"Failed to delete ticket channel: {result}")
 
         # Send Transcript log if configured
-        config = await self.pool.fetchrow("SELECT transcript_channel_id FROM public.ticket_system_config WHERE guild_id = $1", str(interaction.guild_id))
+        config = await self.system.get_config(interaction.guild_id)
         if config and config['transcript_channel_id']:
-            log_channel = interaction.guild.get_channel(int(config['transcript_channel_id']))
+            log_channel = interaction.guild.get_channel(config['transcript_channel_id'])
             if log_channel:
                 embed = discord.Embed(title="Ticket Closed", color=discord.Color.red())
                 embed.add_field(name="Ticket ID", value=ticket_id)
                 embed.add_field(name="Closed By", value=interaction.user.mention)
                 
-                # Check message length limit (2000 chars for Discord)
-                if len(transcript_text) < 1900:
+                # Check message length limit (2000 chars for Discord), measured in encoded bytes
+                transcript_bytes = transcript_text.encode('utf-8')
+                if len(transcript_bytes) < 1900:
                     embed.description = f"**Transcript**:\n```\n{transcript_text}\n```"
                     await log_channel.send(embed=embed)
                 else:
-                     file = discord.File(io.StringIO(transcript_text), filename=f"transcript-{ticket_id}.txt")
+                     file = discord.File(io.BytesIO(transcript_bytes), filename=f"transcript-{ticket_id}.txt")
                      await log_channel.send(embed=embed, file=file)
 
 class TicketSystem:
     def __init__(self, bot: commands.Bot, pool: asyncpg.Pool):
         self.bot = bot
         self.pool = pool
-        self.check_inactivity.start()
+        self._config_cache: dict[int, tuple[float, dict]] = {}
+        # guild_id -> ((category_id, admin_role_id), category, admin_role)
+        self._resolved: dict[int, tuple[tuple, discord.CategoryChannel, discord.Role | None]] = {}
         
         # Register persistent views
-        self.bot.add_view(TicketView(bot, pool))
-        self.bot.add_view(CloseTicketView(bot, pool))
+        # Both views are stateless, so one instance of each serves every message
+        self.ticket_view = TicketView(self)
+        self.close_view = CloseTicketView(self)
+        self.bot.add_view(self.ticket_view)
+        self.bot.add_view(self.close_view)
         log.info("Ticket System initialized.")
 
+    async def get_config(self, guild_id: int):
+        """Return the guild's ticket_system_config row, cached for CONFIG_CACHE_TTL seconds."""
+        cached = self._config_cache.get(guild_id)
+        now = time.monotonic()
+        if cached and now - cached[0] < CONFIG_CACHE_TTL:
+            return cached[1]
+
+        config = await self.pool.fetchrow("SELECT * FROM public.ticket_system_config WHERE guild_id = $1", guild_id)
+        if config:
+            config = dict(config)
+            self._config_cache[guild_id] = (now, config)
+        return config
+
+    async def get_config_and_open_ticket(self, guild_id: int, user_id: int):
+        """
+        Return `(config, open_ticket_id)` for a user pressing Open Ticket.
+
+        Uses the cached config when fresh; otherwise fetches config and the
+        user's open ticket together with a single LEFT JOIN.
+        """
+        cached = self._config_cache.get(guild_id)
+        now = time.monotonic()
+        if cached and now - cached[0] < CONFIG_CACHE_TTL:
+            existing = await self.pool.fetchval(
+                "SELECT ticket_id FROM public.ticket_transcripts WHERE guild_id = $1 AND opener_user_id = $2 AND status = 'open'",
+                guild_id, user_id
+            )
+            return cached[1], existing
+
+        row = await self.pool.fetchrow(
+            """SELECT c.*, t.ticket_id AS open_ticket_id
+               FROM public.ticket_system_config c
+               LEFT JOIN public.ticket_transcripts t
+                 ON t.guild_id = c.guild_id AND t.opener_user_id = $2 AND t.status = 'open'
+               WHERE c.guild_id = $1
+               LIMIT 1""",
+            guild_id, user_id
+        )
+        if not row:
+            return None, None
+
+        config = dict(row)
+        existing = config.pop("open_ticket_id")
+        self._config_cache[guild_id] = (now, config)
+        return config, existing
+
+    def invalidate_config_cache(self, guild_id):
+        """Drop the cached config so the next lookup re-reads the database (accepts str or int ids)."""
+        self._config_cache.pop(int(guild_id), None)
+
+    def resolve_targets(self, guild: discord.Guild, config: dict):
+        """Return the guild's ticket `(category, admin_role)`, memoized until the configured ids change."""
+        key = (config['ticket_category_id'], config['admin_role_id'])
+        cached = self._resolved.get(guild.id)
+        if cached and cached[0] == key:
+            return cached[1], cached[2]
+
+        category = guild.get_channel(key[0]) if key[0] else None
+        admin_role = guild.get_role(key[1]) if key[1] else None
+        if category:
+            self._resolved[guild.id] = (key, category, admin_role)
+        return category, admin_role
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        # Ticket and temp voice channels are deleted constantly; only the cached category matters
+        cached = self._resolved.get(channel.guild.id)
+        if cached and cached[0][0] == channel.id:
+            del self._resolved[channel.guild.id]
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        cached = self._resolved.get(role.guild.id)
+        if cached and cached[0][1] == role.id:
+            del self._resolved[role.guild.id]
+
+    async def start(self):
+        self.bot.add_listener(self.on_guild_channel_delete, "on_guild_channel_delete")
+        self.bot.add_listener(self.on_guild_role_delete, "on_guild_role_delete")
+        try:
+            await self.ensure_schema()
+        except Exception as e:
+            log.error(f"⚠️ Could not ensure ticket schema: {e}")
+        self.check_inactivity.start()
+
+    async def ensure_schema(self):
+        """Add columns and indexes introduced after the original ticket tables were created."""
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                "ALTER TABLE public.ticket_transcripts ADD COLUMN IF NOT EXISTS voice_channel_id BIGINT"
+            )
+            # Snowflake columns used to be TEXT; convert them once (a NULL closer means the bot closed it)
+            await conn.execute("""
+                DO $$
+                BEGIN
+                    IF (SELECT data_type FROM information_schema.columns
+                        WHERE table_schema = 'public' AND table_name = 'ticket_system_config' AND column_name = 'guild_id') = 'text' THEN
+                        ALTER TABLE public.ticket_system_config
+                            ALTER COLUMN guild_id TYPE BIGINT USING guild_id::bigint,
+                            ALTER COLUMN ticket_channel_id TYPE BIGINT USING ticket_channel_id::bigint,
+                            ALTER COLUMN ticket_category_id TYPE BIGINT USING ticket_category_id::bigint,
+                            ALTER COLUMN transcript_channel_id TYPE BIGINT USING transcript_channel_id::bigint,
+                            ALTER COLUMN admin_role_id TYPE BIGINT USING admin_role_id::bigint;
+                    END IF;
+                    IF (SELECT data_type FROM information_schema.columns
+                        WHERE table_schema = 'public' AND table_name = 'ticket_transcripts' AND column_name = 'guild_id') = 'text' THEN
+                        ALTER TABLE public.ticket_transcripts
+                            ALTER COLUMN ticket_id TYPE BIGINT USING ticket_id::bigint,
+                            ALTER COLUMN guild_id TYPE BIGINT USING guild_id::bigint,
+                            ALTER COLUMN opener_user_id TYPE BIGINT USING opener_user_id::bigint,
+                            ALTER COLUMN closer_user_id TYPE BIGINT USING NULLIF(closer_user_id, 'system')::bigint,
+                            ALTER COLUMN voice_channel_id TYPE BIGINT USING voice_channel_id::bigint;
+                    END IF;
+                END
+                $$;
+            """)
+            # Partial indexes: open tickets are a small slice of the transcript history
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tickets_open_lookup
+                    ON public.ticket_transcripts (guild_id, opener_user_id) WHERE status = 'open';
+                CREATE INDEX IF NOT EXISTS idx_tickets_open_guild
+                    ON public.ticket_transcripts (guild_id) WHERE status = 'open';
+                CREATE INDEX IF NOT EXISTS idx_tickets_closed_recent
+                    ON public.ticket_transcripts (guild_id, closed_at DESC) WHERE status = 'closed';
+            """)
+
     def stop(self):
         self.check_inactivity.cancel()
 
+    @property
+    def background_tasks(self) -> list:
+        task = self.check_inactivity.get_task()
+        return [task] if task is not None else []
+
     def register_commands(self):
         @self.bot.tree.command(name="tt1-setup", description="Setup the ticket system")
         @app_commands.describe(channel="Channel to post the ticket button", category="Category to create tickets in", admin_role="Role that can manage tickets", transcript_channel="Channel to log transcripts")
@@ -209,14 +391,15 @@ class TicketSystem:
                 ON CONFLICT (guild_id) DO UPDATE
                 SET ticket_channel_id = $2, ticket_category_id = $3, admin_role_id = $4, transcript_channel_id = $5
             """
-            await self.pool.execute(query, str(interaction.guild_id), str(channel.id), str(category.id), str(admin_role.id), str(transcript_channel.id) if transcript_channel else None)
+            await self.pool.execute(query, interaction.guild_id, channel.id, category.id, admin_role.id, transcript_channel.id if transcript_channel else None)
+            self.invalidate_config_cache(interaction.guild_id)
 
             embed = discord.Embed(
                 title="Support Tickets",
                 description="Click the button below to open a support ticket.",
                 color=discord.Color.green()
             )
-            await channel.send(embed=embed, view=TicketView(self.bot, self.pool))
+            await channel.send(embed=embed, view=self.ticket_view)
             
             await interaction.followup.send(f"Ticket system setup complete! Button posted in {channel.mention}.")
 
@@ -225,57 +408,124 @@ class TicketSystem:
         async def transcript_list(interaction: discord.Interaction):
             rows = await self.pool.fetch(
                 "SELECT id, ticket_id, closed_at, opener_user_id FROM public.ticket_transcripts WHERE guild_id = $1 AND status = 'closed' ORDER BY closed_at DESC LIMIT 10",
-                str(interaction.guild_id)
+                interaction.guild_id
             )
             
             if not rows:
                 await interaction.response.send_message("No transcripts found.", ephemeral=True)
                 return
 
+            # Resolve openers from the member cache, then fetch any misses in one gateway request
+            guild = interaction.guild
+            opener_ids = {row['opener_user_id'] for row in rows}
+            openers = {uid: member for uid in opener_ids if (member := guild.get_member(uid))}
+            missing = opener_ids - openers.keys()
+            if missing:
+                await interaction.response.defer()
+                try:
+                    for member in await guild.query_members(user_ids=list(missing), limit=len(missing)):
+                        openers[member.id] = member
+                except Exception as e:
+                    log.warning(f"Could not query transcript openers: {e}")
+
             embed = discord.Embed(title="Recent Transcripts", color=discord.Color.blue())
             for row in rows:
-                opener = interaction.guild.get_member(int(row['opener_user_id']))
+                opener = openers.get(row['opener_user_id'])
                 opener_name = opener.name if opener else "Unknown"
                 date_str = row['closed_at'].strftime("%Y-%m-%d %H:%M")
                 # Using localhost URL as placeholder, should be dynamic in prod but this is valid per requirements
                 dashboard_link = f"[View on Dashboard](http://localhost:5000/transcript/{row['id']})" 
                 embed.add_field(name=f"Ticket {row['id']} ({date_str})", value=f"Opened by: {opener_name}\n{dashboard_link}", inline=False)
             
-            await interaction.response.send_message(embed=embed)
+            if interaction.response.is_done():
+                await interaction.followup.send(embed=embed)
+            else:
+                await interaction.response.send_message(embed=embed)
         
         log.info("Ticket System commands registered.")
 
+    async def _process_ticket(self, row, semaphore: asyncio.Semaphore, now: datetime):
+        """Inspect one open ticket; returns ('ghost', ticket_id), ('closed', (transcript, ticket_id), channel) or None."""
+        guild = self.bot.get_guild(row['guild_id'])
+        if not guild:
+            return None
+
+        channel = guild.get_channel(row['ticket_id'])
+        if not channel:
+            # Channel deleted manually? Close it in DB
+            return ('ghost', row['ticket_id'])
+
+        # last_message_id is kept current by the gateway, so no history request is needed
+        last_message_id = channel.last_message_id
+        last_message_time = discord.utils.snowflake_time(last_message_id) if last_message_id else channel.created_at
+        if (now - last_message_time).total_seconds() <= INACTIVITY_SECONDS:
+            return None
+
+        # Auto close; the channel is only deleted once the transcript is saved
+        async with semaphore:
+            transcript_text = await _build_transcript(channel)
+        return ('closed', (transcript_text, row['ticket_id']), channel)
+
+    async def _delete_closed_channel(self, channel, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            await channel.delete(reason="Auto-closed due to inactivity")
+
     @tasks.loop(hours=1)
     async def check_inactivity(self):
-        rows = await self.pool.fetch("SELECT ticket_id, guild_id FROM public.ticket_transcripts WHERE status = 'open'")
-        for row in rows:
-            guild = self.bot.get_guild(int(row['guild_id']))
-            if not guild: continue
-            
-            channel = guild.get_channel(int(row['ticket_id']))
-            if not channel:
-                # Channel deleted manually? Close it in DB
-                await self.pool.execute("UPDATE public.ticket_transcripts SET status = 'closed', closed_at = NOW() WHERE ticket_id = $1", row['ticket_id'])
+        guild_ids = [g.id for g in self.bot.guilds]
+        rows = await self.pool.fetch(
+            "SELECT ticket_id, guild_id FROM public.ticket_transcripts WHERE status = 'open' AND guild_id = ANY($1::bigint[])",
+            guild_ids
+        )
+
+        semaphore = asyncio.Semaphore(INACTIVITY_CONCURRENCY)
+        now = datetime.now(timezone.utc)
+        results = await asyncio.gather(
+            *(self._process_ticket(row, semaphore, now) for row in rows),
+            return_exceptions=True
+        )
+
+        ghost_ids: list[int] = []
+        auto_closed: list[tuple[str, int]] = []  # (transcript_text, ticket_id)
+        closed_channels = []
+        for row, result in zip(rows, results):
+            if isinstance(result, Exception):
+                log.error(f"Inactivity check failed for ticket {row['ticket_id']}: {result}")
+            elif result is None:
                 continue
+            elif result[0] == 'ghost':
+                ghost_ids.append(result[1])
+            else:
+                auto_closed.append(result[1])
+                closed_channels.append(result[2])
 
-            last_message_time = channel.created_at
-            async for msg in channel.history(limit=1):
-                last_message_time = msg.created_at
-            
-            if (datetime.now(timezone.utc) - last_message_time).total_seconds() > 6 * 3600: # 6 hours
-                # Auto close
-                messages = [message async for message in channel.history(limit=500, oldest_first=True)]
-                transcript_lines = []
-                for msg in messages:
-                    timestamp = msg.created_at.strftime("%Y-%m-%d %H:%M:%S")
-                    transcript_lines.append(f"[{timestamp}] {msg.author.name}: {msg.content}")
-                
-                transcript_text = "\n".join(transcript_lines)
-                
+        # Persist all closures in at most two statements
+        if ghost_ids:
+            try:
                 await self.pool.execute(
+                    "UPDATE public.ticket_transcripts SET status = 'closed', closed_at = NOW() WHERE ticket_id = ANY($1::bigint[])",
+                    ghost_ids
+                )
+            except Exception as e:
+                log.error(f"Failed to close ghost tickets {ghost_ids}: {e}")
+        if auto_closed:
+            try:
+                await self.pool.executemany(
                     """UPDATE public.ticket_transcripts 
-                       SET status = 'closed', closed_at = NOW(), transcript_text = $1, closer_user_id = 'system'
+                       SET status = 'closed', closed_at = NOW(), transcript_text = $1, closer_user_id = NULL
                        WHERE ticket_id = $2""",
-                    transcript_text, row['ticket_id']
+                    auto_closed
                 )
-                await channel.delete(reason="Auto-closed due to inactivity")
+            except Exception as e:
+                # Channels are kept, so the next sweep retries with the transcript intact
+                failed_ids = [ticket_id for _, ticket_id in auto_closed]
+                log.error(f"Failed to save auto-closed tickets {failed_ids}: {e}")
+                return
+
+            delete_results = await asyncio.gather(
+                *(self._delete_closed_channel(channel, semaphore) for channel in closed_channels),
+                return_exceptions=True
+            )
+            for channel, result in zip(closed_channels, delete_results):
+                if isinstance(result, Exception):
+                    log.error(f"Failed to delete auto-closed ticket channel {channel.id}: {result}")
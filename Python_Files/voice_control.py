@@ -28,19 +28,38 @@ class LimitModal(ui.Modal, title="Set User Limit"):
             await interaction.response.send_message("❌ Please enter a valid number between 0 and 99.", ephemeral=True)
 
 class VoiceControlView(ui.View):
-    def __init__(self, bot, pool, owner_id):
+    """
+    Single persistent control panel shared by every private voice channel.
+
+    The owner is looked up per channel from `voice_temp_channels.owner_user_id`
+    and memoized in `owners`, so the view keeps working across restarts.
+    """
+
+    def __init__(self, bot, pool):
         super().__init__(timeout=None) # Persistent view
         self.bot = bot
         self.pool = pool
-        self.owner_id = int(owner_id) if owner_id else None
+        self.owners: dict[int, int | None] = {}  # {channel_id: owner_id}
+
+    async def get_owner_id(self, channel_id: int):
+        if channel_id in self.owners:
+            return self.owners[channel_id]
+        owner = await self.pool.fetchval(
+            "SELECT owner_user_id FROM public.voice_temp_channels WHERE channel_id = $1 AND deleted_at IS NULL",
+            str(channel_id)
+        )
+        owner_id = int(owner) if owner else None
+        self.owners[channel_id] = owner_id
+        return owner_id
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if not self.owner_id:
+        owner_id = await self.get_owner_id(interaction.channel.id)
+        if not owner_id:
             # Fallback for orphaned channels or weird states
             await interaction.response.send_message("❌ This channel has no active owner.", ephemeral=True)
             return False
             
-        if interaction.user.id != self.owner_id:
+        if interaction.user.id != owner_id:
             # Check if admin
             if interaction.user.guild_permissions.administrator:
                 return True
@@ -50,15 +69,19 @@ class VoiceControlView(ui.View):
 
     @ui.button(label="🔒 Lock", style=discord.ButtonStyle.secondary, custom_id="vc_lock")
     async def lock_channel(self, interaction: discord.Interaction, button: ui.Button):
-        # Deny connect for @everyone
-        overwrite = interaction.channel.overwrites_for(interaction.guild.default_role)
+        # Deny connect for @everyone and ensure owner can still connect, in a single edit
+        channel = interaction.channel
+        overwrites = dict(channel.overwrites)
+
+        overwrite = channel.overwrites_for(interaction.guild.default_role)
         overwrite.connect = False
-        await interaction.channel.set_permissions(interaction.guild.default_role, overwrite=overwrite)
-        
-        # Ensure owner can still connect
-        owner_overwrite = interaction.channel.overwrites_for(interaction.user)
+        overwrites[interaction.guild.default_role] = overwrite
+
+        owner_overwrite = channel.overwrites_for(interaction.user)
         owner_overwrite.connect = True
-        await interaction.channel.set_permissions(interaction.user, overwrite=owner_overwrite)
+        overwrites[interaction.user] = owner_overwrite
+
+        await channel.edit(overwrites=overwrites)
 
         await interaction.response.send_message("🔒 Channel **LOCKED** (Invite only).", ephemeral=True)
 
@@ -103,71 +126,73 @@ class VoiceControlView(ui.View):
 
     @ui.button(label="➕ Add Role", style=discord.ButtonStyle.success, custom_id="vc_add_role")
     async def add_role_permission(self, interaction: discord.Interaction, button: ui.Button):
-        # RoleSelect is available in discord.py 2.0+
-        select = ui.RoleSelect(placeholder="Select a role to permit", min_values=1, max_values=1)
-
-        async def select_callback(select_interaction: discord.Interaction):
-            role = select.values[0]
-            # Grant view and connect
-            overwrite = interaction.channel.overwrites_for(role)
-            overwrite.view_channel = True
-            overwrite.connect = True
-            await interaction.channel.set_permissions(role, overwrite=overwrite)
-            
-            await select_interaction.response.send_message(f"✅ Users with role **{role.name}** can now see and join this channel.", ephemeral=True)
-
-        select.callback = select_callback
-        view = ui.View()
-        view.add_item(select)
-        await interaction.response.send_message("Select a role to give access to this channel:", view=view, ephemeral=True)
+        await interaction.response.send_message("Select a role to give access to this channel:", view=_select_view(PermitRoleSelect()), ephemeral=True)
 
     @ui.button(label="🛑 Disconnect User", style=discord.ButtonStyle.danger, custom_id="vc_kick_menu")
     async def kick_user_menu(self, interaction: discord.Interaction, button: ui.Button):
-        # Create a select menu of current members
-        members = [m for m in interaction.channel.members if m.id != interaction.user.id and not m.bot]
+        # Select options for current members, built in one pass (max 25 items in select menu)
+        options = [
+            discord.SelectOption(label=m.display_name, value=str(m.id))
+            for m in interaction.channel.members
+            if m.id != interaction.user.id and not m.bot
+        ][:25]
         
-        if not members:
+        if not options:
             await interaction.response.send_message("❌ No other users to disconnect.", ephemeral=True)
             return
 
-        # Max 25 items in select menu
-        options = [discord.SelectOption(label=m.display_name, value=str(m.id)) for m in members[:25]]
-        
-        select = ui.Select(placeholder="Select user to disconnect", options=options)
-        
-        async def kick_callback(select_interaction: discord.Interaction):
-            target_id = int(select.values[0])
-            target = interaction.guild.get_member(target_id)
-            if target:
-                try:
-                    await target.move_to(None) # Disconnect
-                    await select_interaction.response.send_message(f"👋 Disconnected **{target.display_name}**.", ephemeral=True)
-                except discord.Forbidden:
-                    await select_interaction.response.send_message("❌ I don't have permission to disconnect that user (admin/higher role?).", ephemeral=True)
-            else:
-                await select_interaction.response.send_message("❌ User not found.", ephemeral=True)
-
-        select.callback = kick_callback
-        view = ui.View()
-        view.add_item(select)
-        await interaction.response.send_message("Select a user to disconnect:", view=view, ephemeral=True)
+        await interaction.response.send_message("Select a user to disconnect:", view=_select_view(DisconnectUserSelect(options)), ephemeral=True)
 
     @ui.button(label="👤 Permit User", style=discord.ButtonStyle.success, custom_id="vc_permit")
     async def permit_user(self, interaction: discord.Interaction, button: ui.Button):
-        # Use UserSelect for better UX
-        select = ui.UserSelect(placeholder="Select a user to permit", min_values=1, max_values=1)
-
-        async def select_callback(select_interaction: discord.Interaction):
-            user = select.values[0]
-            # Grant view and connect
-            overwrite = interaction.channel.overwrites_for(user)
-            overwrite.view_channel = True
-            overwrite.connect = True
-            await interaction.channel.set_permissions(user, overwrite=overwrite)
-            
-            await select_interaction.response.send_message(f"✅ **{user.display_name}** can now see and join this channel.", ephemeral=True)
-
-        select.callback = select_callback
-        view = ui.View()
-        view.add_item(select)
-        await interaction.response.send_message("Select a user to give access to this channel:", view=view, ephemeral=True)
+        await interaction.response.send_message("Select a user to give access to this channel:", view=_select_view(PermitUserSelect()), ephemeral=True)
+
+
+# --- Select menus sent by the control panel ---
+# Callbacks read the channel from the select interaction itself (the panel and
+# its ephemeral menus live in the same voice channel), so no per-click closures.
+
+def _select_view(select: ui.Item) -> ui.View:
+    view = ui.View()
+    view.add_item(select)
+    return view
+
+async def _grant_access(interaction: discord.Interaction, target):
+    # Grant view and connect
+    overwrite = interaction.channel.overwrites_for(target)
+    overwrite.view_channel = True
+    overwrite.connect = True
+    await interaction.channel.set_permissions(target, overwrite=overwrite)
+
+class PermitRoleSelect(ui.RoleSelect):
+    def __init__(self):
+        super().__init__(placeholder="Select a role to permit", min_values=1, max_values=1)
+
+    async def callback(self, interaction: discord.Interaction):
+        role = self.values[0]
+        await _grant_access(interaction, role)
+        await interaction.response.send_message(f"✅ Users with role **{role.name}** can now see and join this channel.", ephemeral=True)
+
+class PermitUserSelect(ui.UserSelect):
+    def __init__(self):
+        super().__init__(placeholder="Select a user to permit", min_values=1, max_values=1)
+
+    async def callback(self, interaction: discord.Interaction):
+        user = self.values[0]
+        await _grant_access(interaction, user)
+        await interaction.response.send_message(f"✅ **{user.display_name}** can now see and join this channel.", ephemeral=True)
+
+class DisconnectUserSelect(ui.Select):
+    def __init__(self, options: list[discord.SelectOption]):
+        super().__init__(placeholder="Select user to disconnect", options=options)
+
+    async def callback(self, interaction: discord.Interaction):
+        target = interaction.guild.get_member(int(self.values[0]))
+        if target:
+            try:
+                await target.move_to(None) # Disconnect
+                await interaction.response.send_message(f"👋 Disconnected **{target.display_name}**.", ephemeral=True)
+            except discord.Forbidden:
+                await interaction.response.send_message("❌ I don't have permission to disconnect that user (admin/higher role?).", ephemeral=True)
+        else:
+            await interaction.response.send_message("❌ User not found.", ephemeral=True)
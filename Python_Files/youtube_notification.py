@@ -3,20 +3,194 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, time, timezone, timedelta
 import asyncio
+from collections import defaultdict
 import asyncpg
 import logging
 import aiohttp
-import feedparser
 import re
 import os
+import json
+from typing import NamedTuple
+from xml.etree import ElementTree
+
+# orjson is optional; discord.py also picks it up automatically when installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 log = logging.getLogger(__name__)
 IST = timezone(timedelta(hours=5, minutes=30))
 
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 
+# YouTube channel IDs: "UC" + 22 URL-safe base64 characters
+_CHANNEL_ID_RE = re.compile(r"UC[A-Za-z0-9_-]{22}")
+_CHANNEL_URL_RE = re.compile(r"/channel/(UC[A-Za-z0-9_-]{22})")
+
+# Placeholders accepted in custom notification messages
+_PLACEHOLDER_RE = re.compile(
+    r"\{(channel_name|video_title|video_url|@everyone|@here|@role)\}( ?)"
+)
+DEFAULT_NOTIFICATION_MESSAGE = (
+    "🔔 {@role} **{channel_name}** has uploaded a new video!\n\n"
+    "**{video_title}**\n{video_url}"
+)
+
+# Video log rows are pruned after this many days
+LOG_RETENTION_DAYS = 30
+# The polling query looks a little further back than retention: the daily prune
+# leaves rows up to a day past it, and those still block re-inserts, so they must
+# also be in seen_ids for the early break to fire.
+SEEN_WINDOW_DAYS = LOG_RETENTION_DAYS + 2
+
+# Enabled configs plus the video ids each one logged recently, so the polling
+# loop needs no per-config existence query. Anything older than the window that
+# is still in a feed is past the 1-hour notify cutoff, so at worst it is
+# re-logged as 'none' (ON CONFLICT DO NOTHING) and never re-announced.
+SQL_ENABLED_CONFIGS_WITH_SEEN = f"""
+    SELECT c.*, COALESCE(l.seen_ids, '{{}}') AS seen_ids
+    FROM public.youtube_notification_config c
+    LEFT JOIN LATERAL (
+        SELECT array_agg(video_id) AS seen_ids
+        FROM public.youtube_notification_logs
+        WHERE guild_id = c.guild_id
+          AND yt_channel_id = c.yt_channel_id
+          AND notified_at > NOW() - INTERVAL '{SEEN_WINDOW_DAYS} days'
+    ) l ON TRUE
+    WHERE c.is_enabled = TRUE
+"""
+
+# Polling runs on the wall-clock quarter hours (hh:00, hh:15, hh:30, hh:45 IST)
+CHECK_TIMES = [
+    time(hour=h, minute=m, tzinfo=IST) for h in range(24) for m in (0, 15, 30, 45)
+]
+
+# Max RSS feeds downloaded at once during a polling tick
+RSS_FETCH_CONCURRENCY = 10
+
+# Quiet channels (newest video unchanged) are polled every tick, then every 2.
+# The 30-minute cap leaves room for RSS lag inside the 1-hour notification
+# window, so a quiet channel's next upload is still seen young enough to announce.
+POLL_INTERVAL = timedelta(minutes=15)
+POLL_BACKOFF_MAX_TICKS = 2
+
+# Hot-path statements are module constants: with the pool's statement cache
+# enabled (direct / session connections, see supporter.create_pool) asyncpg keys
+# its per-connection prepared statements on the exact SQL text, so each one is
+# parsed and planned once per connection rather than once per call.
+
+SQL_LOGGED_VIDEO_IDS = """
+    SELECT video_id FROM public.youtube_notification_logs
+    WHERE guild_id = $1 AND yt_channel_id = $2 AND video_id = ANY($3::text[])
+"""
+
+# Slash-command statements, likewise fixed text so the statement cache can reuse them.
+# Upsert params: $1 guild, $2 yt channel, $3 target channel, $4 role, $5 yt channel
+# name, $6 custom message (NULL keeps the stored one), $7 default message for new rows.
+SQL_UPSERT_CONFIG = """
+    INSERT INTO public.youtube_notification_config
+    (guild_id, yt_channel_id, target_channel_id, mention_role_id,
+        is_enabled, yt_channel_name, custom_message)
+    VALUES ($1, $2, $3, $4, TRUE, $5, COALESCE($6, $7))
+    ON CONFLICT (guild_id, yt_channel_id) DO UPDATE SET
+        target_channel_id = EXCLUDED.target_channel_id,
+        mention_role_id = EXCLUDED.mention_role_id,
+        is_enabled = TRUE,
+        yt_channel_name = EXCLUDED.yt_channel_name,
+        custom_message = COALESCE($6, youtube_notification_config.custom_message),
+        updated_at = NOW()
+    RETURNING (xmax = 0) AS inserted
+"""
+SQL_DELETE_CONFIG = """
+    DELETE FROM public.youtube_notification_config
+    WHERE guild_id = $1 AND yt_channel_id = $2
+    RETURNING 1
+"""
+SQL_LIST_CONFIGS = """
+    SELECT * FROM public.youtube_notification_config
+    WHERE guild_id = $1 ORDER BY yt_channel_name
+"""
+
+# (guild_id, yt_channel_id, video_id, video_status) rows, written with executemany
+SQL_INSERT_VIDEO_LOG = """
+    INSERT INTO public.youtube_notification_logs
+    (guild_id, yt_channel_id, video_id, video_status)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT DO NOTHING
+"""
+
+# XML namespaces of YouTube's videos.xml (Atom + yt: extensions)
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+
+
+class YouTubeFeed(NamedTuple):
+    """Parsed RSS feed: channel title plus entries shaped by `_extract_video_info`."""
+
+    title: str | None
+    entries: list
+
+
+def _extract_video_info(entry):
+    """
+    Extract structured video information from a single Atom `<entry>` element.
+
+    Returns
+    -------
+    dict | None
+        Dictionary with keys: video_id, title, link, channel_name, published_at;
+        or None if extraction fails.
+    """
+    try:
+        video_id = entry.findtext(f"{_YT}videoId")
+        published_str = entry.findtext(f"{_ATOM}published")
+        if not video_id or not published_str:
+            return None
+        published_at = datetime.fromisoformat(published_str)
+        link = entry.find(f"{_ATOM}link")
+        return {
+            "video_id": video_id,
+            "title": entry.findtext(f"{_ATOM}title") or "Untitled",
+            "link": link.get("href") if link is not None else f"https://www.youtube.com/watch?v={video_id}",
+            "channel_name": entry.findtext(f"{_ATOM}author/{_ATOM}name") or "Unknown Channel",
+            "published_at": published_at,
+        }
+    except Exception as e:
+        log.error(f"Error extracting video info from RSS entry: {e}")
+        return None
+
+
+def _parse_yt_feed(xml_content: bytes):
+    """
+    Parse a YouTube channel `videos.xml` document.
+
+    The schema is fixed, so entries are read directly from the element tree
+    instead of going through a general-purpose feed parser.
+
+    Returns
+    -------
+    YouTubeFeed | None
+        The parsed feed, or None if the document is not valid XML.
+    """
+    try:
+        root = ElementTree.fromstring(xml_content)
+    except ElementTree.ParseError as e:
+        log.error(f"Invalid RSS XML: {e}")
+        return None
+    entries = [
+        info
+        for info in map(_extract_video_info, root.iterfind(f"{_ATOM}entry"))
+        if info
+    ]
+    # Newest first, so consumers can stop at the first already-logged video
+    entries.sort(key=lambda info: info["published_at"], reverse=True)
+    return YouTubeFeed(root.findtext(f"{_ATOM}title"), entries)
+
 
 class YouTubeManager:
     """
@@ -44,6 +218,14 @@ class YouTubeManager:
         self.pool = pool
         self.session = None
         self.youtube_api_key = YOUTUBE_API_KEY
+        # {yt_channel_id: (etag, last_modified, parsed_feed)} for conditional RSS requests
+        self._feed_cache: dict = {}
+        # {(guild_id, yt_channel_id): (updated_at, (guild, channel, role))}
+        self._resolved: dict = {}
+        # {yt_channel_id: (newest_video_id, quiet_polls, next_check)} for poll backoff
+        self._poll_state: dict = {}
+        # Shared by the poller and slash commands so overlapping callers stay bounded
+        self._rss_semaphore = asyncio.Semaphore(RSS_FETCH_CONCURRENCY)
 
         log.info("YouTube Notification system (RSS) has been initialized.")
         if self.youtube_api_key:
@@ -57,9 +239,59 @@ class YouTubeManager:
 
         Creates a shared aiohttp.ClientSession and starts the periodic
         task that checks for new YouTube videos.
+
+        Nearly all traffic goes to youtube.com and googleapis.com, so the
+        connector keeps connections alive between ticks and caches DNS.
         """
-        self.session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10),
+            headers={"User-Agent": "SupporterBot/5.0", "Accept-Encoding": "gzip, deflate"},
+        )
+        try:
+            await self.ensure_schema()
+        except Exception as e:
+            log.error(f"⚠️ Could not ensure YouTube notification schema: {e}")
         self.check_for_videos.start()
+        self.prune_video_logs.start()
+
+    async def ensure_schema(self):
+        """
+        Migrate the config's Discord target ids to BIGINT and create the
+        indexes backing the polling query.
+
+        `guild_id` stays TEXT like every other guild-keyed table, since guild
+        cleanup and stats bind one `$1` across them. `(guild_id, yt_channel_id)`
+        lookups on the config table use its primary key, and
+        `(guild_id, yt_channel_id, video_id)` on the logs is covered by the
+        `youtube_logs_unique_video` constraint used by ON CONFLICT.
+        """
+        await self.pool.execute(
+            """DO $$
+            BEGIN
+                IF (SELECT data_type FROM information_schema.columns
+                    WHERE table_schema = 'public' AND table_name = 'youtube_notification_config'
+                      AND column_name = 'target_channel_id') = 'text' THEN
+                    ALTER TABLE public.youtube_notification_config
+                        ALTER COLUMN target_channel_id TYPE BIGINT USING target_channel_id::bigint,
+                        ALTER COLUMN mention_role_id TYPE BIGINT USING NULLIF(mention_role_id, '')::bigint;
+                END IF;
+            END
+            $$;
+            CREATE INDEX IF NOT EXISTS idx_youtube_logs_recent
+               ON public.youtube_notification_logs (guild_id, yt_channel_id, notified_at DESC)
+               INCLUDE (video_id);
+            CREATE INDEX IF NOT EXISTS idx_youtube_config_enabled
+               ON public.youtube_notification_config (yt_channel_id)
+               WHERE is_enabled"""
+        )
 
     async def stop(self):
         """
@@ -70,6 +302,7 @@ class YouTubeManager:
         """
         if self.check_for_videos.is_running():
             self.check_for_videos.cancel()
+        self.prune_video_logs.cancel()
 
         if self.session:
             await self.session.close()
@@ -77,6 +310,17 @@ class YouTubeManager:
 
         log.info("YouTubeManager stopped.")
 
+    @property
+    def background_tasks(self) -> list:
+        """
+        The asyncio Tasks driving the RSS polling and log pruning loops, if started.
+        """
+        return [
+            t
+            for t in (self.check_for_videos.get_task(), self.prune_video_logs.get_task())
+            if t is not None
+        ]
+
     async def close(self):
         """
         Backwards-compatible alias for stop().
@@ -89,6 +333,10 @@ class YouTubeManager:
         """
         Fetch and parse the YouTube RSS feed for a given channel.
 
+        Sends the previous response's ETag / Last-Modified; on a 304 the
+        cached parsed feed is returned without downloading or re-parsing.
+        At most RSS_FETCH_CONCURRENCY requests are in flight across all callers.
+
         Parameters
         ----------
         yt_channel_id : str
@@ -96,12 +344,24 @@ class YouTubeManager:
 
         Returns
         -------
-        feedparser.FeedParserDict | None
-            Parsed feed object on success, or None on failure.
+        YouTubeFeed | None
+            Parsed feed on success, or None on failure.
         """
         rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={yt_channel_id}"
+        cached = self._feed_cache.get(yt_channel_id)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
-            async with self.session.get(rss_url, timeout=10) as response:
+            async with self._rss_semaphore, self.session.get(
+                rss_url, headers=headers, timeout=10
+            ) as response:
+                if response.status == 304 and cached:
+                    return cached[2]
                 if response.status != 200:
                     if response.status in (404, 429, 500, 502, 503, 504):
                         log.warning(
@@ -112,48 +372,30 @@ class YouTubeManager:
                             f"YouTube RSS unexpected status ({response.status}) for {yt_channel_id}"
                         )
                     return None
-                xml_content = await response.text()
-                feed = await self.bot.loop.run_in_executor(
-                    None, feedparser.parse, xml_content
-                )
+                xml_content = await response.read()
+                # Parse off the event loop so gateway heartbeats aren't stalled
+                feed = await asyncio.to_thread(_parse_yt_feed, xml_content)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._feed_cache[yt_channel_id] = (etag, last_modified, feed)
                 return feed
         except Exception as e:
             log.error(f"Error fetching RSS feed for channel {yt_channel_id}: {e}")
             return None
 
-    def extract_video_info(self, entry):
+    async def fetch_rss_feeds(self, yt_channel_ids) -> dict:
         """
-        Extract structured video information from a single RSS entry.
-
-        Parameters
-        ----------
-        entry : feedparser.FeedParserDict
-            An individual entry from the RSS feed.
+        Fetch several RSS feeds concurrently; fetch_rss_feed bounds concurrency.
 
         Returns
         -------
-        dict | None
-            Dictionary with keys: video_id, title, link, channel_name, published_at;
-            or None if extraction fails.
+        dict
+            Mapping of channel ID to parsed feed (or None on failure).
         """
-        try:
-            video_id = entry.get("yt_videoid")
-            published_str = entry.get("published")
-            if not video_id or not published_str:
-                return None
-            published_at = datetime.strptime(published_str, "%Y-%m-%dT%H:%M:%S%z")
-            return {
-                "video_id": video_id,
-                "title": entry.get("title", "Untitled"),
-                "link": entry.get(
-                    "link", f"https://www.youtube.com/watch?v={video_id}"
-                ),
-                "channel_name": entry.get("author", "Unknown Channel"),
-                "published_at": published_at,
-            }
-        except Exception as e:
-            log.error(f"Error extracting video info from RSS entry: {e}")
-            return None
+        yt_channel_ids = list(yt_channel_ids)
+        feeds = await asyncio.gather(*(self.fetch_rss_feed(c) for c in yt_channel_ids))
+        return dict(zip(yt_channel_ids, feeds))
 
     # ===========================
     # YouTube API lookup helpers
@@ -208,7 +450,7 @@ class YouTubeManager:
                     log.error(f"API Error response: {error_data}")
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=_json_loads)
                 items = data.get("items", [])
                 if not items:
                     log.warning(f"No channel found for handle '@{clean_handle}'")
@@ -262,7 +504,7 @@ class YouTubeManager:
                 if response.status != 200:
                     return None
 
-                data = await response.json()
+                data = await response.json(loads=_json_loads)
 
                 if "items" in data and data["items"]:
                     item = data["items"][0]
@@ -277,6 +519,24 @@ class YouTubeManager:
 
         return None
 
+    async def get_logged_video_ids(
+        self, guild_id: str, yt_channel_id: str, video_ids: list
+    ) -> set:
+        """
+        Return which of `video_ids` are already logged for this guild/channel.
+
+        One `ANY($3)` query replaces a per-video existence check.
+        """
+        if not video_ids:
+            return set()
+        rows = await self.pool.fetch(
+            SQL_LOGGED_VIDEO_IDS,
+            guild_id,
+            yt_channel_id,
+            video_ids,
+        )
+        return {r["video_id"] for r in rows}
+
     async def seed_channel(self, guild_id: str, yt_channel_id: str) -> int:
         """
         Seed recent videos for a newly configured channel.
@@ -298,27 +558,20 @@ class YouTubeManager:
         skipped_old = 0
         notified_new = 0
 
-        for entry in feed.entries[:15]:
-            video_info = self.extract_video_info(entry)
-            if not video_info:
-                continue
+        video_infos = feed.entries[:15]
+        seen = await self.get_logged_video_ids(
+            guild_id, yt_channel_id, [info["video_id"] for info in video_infos]
+        )
 
+        pending_logs = []
+        now = datetime.now(timezone.utc)
+        for video_info in video_infos:
             video_id = video_info["video_id"]
-            published_at = video_info["published_at"]
-
-            age_seconds = (
-                datetime.now(IST) - published_at.astimezone(IST)
-            ).total_seconds()
-
-            exists = await self.pool.fetchval(
-                "SELECT 1 FROM public.youtube_notification_logs WHERE guild_id = $1 AND yt_channel_id = $2 AND video_id = $3",
-                guild_id,
-                yt_channel_id,
-                video_id,
-            )
+            if video_id in seen:
+                # Entries are newest-first: everything after this is logged too
+                break
 
-            if exists:
-                continue
+            age_seconds = (now - video_info["published_at"]).total_seconds()
 
             if age_seconds > 3600:
                 status = "none"
@@ -327,18 +580,15 @@ class YouTubeManager:
                 status = "seeded"
                 notified_new += 1
 
-            await self.pool.execute(
-                """INSERT INTO public.youtube_notification_logs 
-                (guild_id, yt_channel_id, video_id, video_status) 
-                VALUES ($1, $2, $3, $4) 
-                ON CONFLICT DO NOTHING""",
-                guild_id,
-                yt_channel_id,
-                video_id,
-                status,
-            )
+            pending_logs.append((guild_id, yt_channel_id, video_id, status))
             seeded_count += 1
-        
+
+        if pending_logs:
+            # One connection, one transaction: the whole seed commits (or fails) together
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(SQL_INSERT_VIDEO_LOG, pending_logs)
+
         log.info(
             f"✅ Seeded {seeded_count} videos for guild {guild_id}, channel {yt_channel_id} "
             f"({skipped_old} old, {notified_new} recent)"
@@ -348,14 +598,16 @@ class YouTubeManager:
     # ===========================
     # Background polling task
     # ===========================
-    @tasks.loop(minutes=15)
+    @tasks.loop(time=CHECK_TIMES)
     async def check_for_videos(self):
         """
         Periodically check configured YouTube channels for new videos.
 
-        Runs every 15 minutes and follows this logic:
-        1. Fetch enabled notification configurations from the database.
-        2. For each configuration, fetch the RSS feed for the channel.
+        Runs at every quarter hour (see CHECK_TIMES) and follows this logic:
+        1. Fetch enabled notification configurations, each with its recently
+           logged video ids, in a single query.
+        2. Fetch the RSS feed of every channel that is due (see `_record_poll`)
+           concurrently.
         3. For each video in the feed:
            - If already logged: skip.
            - If older than 60 minutes: log with `video_status = 'none'` (no notification).
@@ -367,135 +619,218 @@ class YouTubeManager:
 
         log.info("🔍 Running YouTube RSS notification check...")
 
-        configs = await self.pool.fetch(
-            "SELECT * FROM public.youtube_notification_config WHERE is_enabled = TRUE"
-        )
+        configs = await self.pool.fetch(SQL_ENABLED_CONFIGS_WITH_SEEN)
 
         if not configs:
             log.info("ℹ️ No active YouTube notification configs found")
+            # Nothing is subscribed: drop state left by past polls and ad-hoc lookups
+            self._feed_cache.clear()
+            self._poll_state.clear()
+            self._resolved.clear()
             return
 
-        log.info(f"📊 Checking {len(configs)} YouTube notification config(s)")
-
+        # Group configs by YouTube channel so each feed is downloaded and parsed once
+        by_channel = defaultdict(list)
         for config in configs:
-            guild_id_str = config["guild_id"]
-            yt_channel_id = config["yt_channel_id"]
-            yt_channel_name = config.get("yt_channel_name", "Unknown Channel")
+            by_channel[config["yt_channel_id"]].append(config)
 
-            try:
-                feed = await self.fetch_rss_feed(yt_channel_id)
-                if not feed or not feed.entries:
-                    log.debug(f"No entries in RSS feed for channel {yt_channel_id}")
-                    continue
-
-                for entry in feed.entries:
-                    video_info = self.extract_video_info(entry)
-                    if not video_info:
-                        continue
-
-                    video_id = video_info["video_id"]
-                    published_at = video_info["published_at"]
-
-                    age_seconds = (
-                        datetime.now(IST) - published_at.astimezone(IST)
-                    ).total_seconds()
-
-                    log_exists = await self.pool.fetchval(
-                        "SELECT 1 FROM public.youtube_notification_logs WHERE guild_id = $1 AND yt_channel_id = $2 AND video_id = $3",
-                        guild_id_str,
-                        yt_channel_id,
-                        video_id,
-                    )
-
-                    if log_exists:
-                        continue
+        log.info(
+            f"📊 Checking {len(configs)} YouTube notification config(s) "
+            f"across {len(by_channel)} unique channel(s)"
+        )
 
-                    if age_seconds > 3600:
-                        log.info(
-                            f"📦 Skipping old video ({age_seconds/3600:.2f} hours old): "
-                            f"{video_id} for guild {guild_id_str}"
-                        )
-                        await self.pool.execute(
-                            """INSERT INTO public.youtube_notification_logs 
-                            (guild_id, yt_channel_id, video_id, video_status) 
-                            VALUES ($1, $2, $3, 'none') 
-                            ON CONFLICT DO NOTHING""",
-                            guild_id_str,
-                            yt_channel_id,
-                            video_id,
-                        )
-                    else:
-                        log.info(
-                            f"🆕 New video detected for guild {guild_id_str} on channel {yt_channel_name}: "
-                            f"{video_info['title']} (published {age_seconds/60:.1f} minutes ago)"
-                        )
+        # Forget conditional-GET and backoff state for channels no longer subscribed anywhere,
+        # including feeds only fetched by the setup / test-RSS commands
+        for stale_id in self._feed_cache.keys() - by_channel.keys():
+            del self._feed_cache[stale_id]
+        for stale_id in self._poll_state.keys() - by_channel.keys():
+            del self._poll_state[stale_id]
+        # Removed or disabled configs no longer need their resolved Discord targets
+        live_keys = {(config["guild_id"], config["yt_channel_id"]) for config in configs}
+        for stale_key in self._resolved.keys() - live_keys:
+            del self._resolved[stale_key]
+
+        # Download every due channel's feed once, in parallel
+        polled_at = datetime.now(timezone.utc)
+        due = [
+            yt_channel_id
+            for yt_channel_id in by_channel
+            if yt_channel_id not in self._poll_state
+            or self._poll_state[yt_channel_id][2] <= polled_at
+        ]
+        if len(due) < len(by_channel):
+            log.info(f"⏭️ Backing off {len(by_channel) - len(due)} quiet channel(s) this tick")
+        feeds = await self.fetch_rss_feeds(due)
+
+        for yt_channel_id in due:
+            channel_configs = by_channel[yt_channel_id]
+            feed = feeds.get(yt_channel_id)
+            self._record_poll(yt_channel_id, feed, polled_at)
+            if not feed or not feed.entries:
+                log.debug(f"No entries in RSS feed for channel {yt_channel_id}")
+                continue
 
-                        await self.send_notification(config, video_info)
+            video_infos = feed.entries
+
+            for config in channel_configs:
+                guild_id_str = config["guild_id"]
+                yt_channel_name = config.get("yt_channel_name", "Unknown Channel")
+
+                try:
+                    seen = set(config["seen_ids"])
+
+                    pending_logs = []
+                    now = datetime.now(timezone.utc)
+                    try:
+                        for video_info in video_infos:
+                            video_id = video_info["video_id"]
+                            if video_id in seen:
+                                # Entries are newest-first: everything after this is logged too
+                                break
+
+                            age_seconds = (now - video_info["published_at"]).total_seconds()
+
+                            if age_seconds > 3600:
+                                log.info(
+                                    f"📦 Skipping old video ({age_seconds/3600:.2f} hours old): "
+                                    f"{video_id} for guild {guild_id_str}"
+                                )
+                                pending_logs.append(
+                                    (guild_id_str, yt_channel_id, video_id, "none")
+                                )
+                            else:
+                                log.info(
+                                    f"🆕 New video detected for guild {guild_id_str} on channel {yt_channel_name}: "
+                                    f"{video_info['title']} (published {age_seconds/60:.1f} minutes ago)"
+                                )
+
+                                await self.send_notification(config, video_info)
+
+                                pending_logs.append(
+                                    (guild_id_str, yt_channel_id, video_id, "notified")
+                                )
+
+                                # Pace bursts of real sends only
+                                await asyncio.sleep(0.2)
+                    finally:
+                        # Flush even if a send failed part-way, so sent videos aren't re-notified
+                        if pending_logs:
+                            await self.pool.executemany(SQL_INSERT_VIDEO_LOG, pending_logs)
+
+                except Exception as e:
+                    log.error(
+                        f"❌ Error processing YouTube channel {yt_channel_id} for guild {guild_id_str}: {e}",
+                        exc_info=True,
+                    )
 
-                        await self.pool.execute(
-                            """INSERT INTO public.youtube_notification_logs 
-                            (guild_id, yt_channel_id, video_id, video_status) 
-                            VALUES ($1, $2, $3, 'notified') 
-                            ON CONFLICT DO NOTHING""",
-                            guild_id_str,
-                            yt_channel_id,
-                            video_id,
-                        )
+    def _record_poll(self, yt_channel_id: str, feed, polled_at: datetime):
+        """
+        Schedule a channel's next poll from whether its newest video changed.
 
-                    await asyncio.sleep(0.5)
+        Failed fetches are retried on the next tick; a new upload resets the
+        interval to one tick, and each quiet poll doubles it up to
+        POLL_BACKOFF_MAX_TICKS.
+        """
+        if feed is None:
+            self._poll_state.pop(yt_channel_id, None)
+            return
 
-            except Exception as e:
-                log.error(
-                    f"❌ Error processing YouTube channel {yt_channel_id} for guild {guild_id_str}: {e}",
-                    exc_info=True,
-                )
+        newest = feed.entries[0]["video_id"] if feed.entries else None
+        previous = self._poll_state.get(yt_channel_id)
+        quiet = (
+            min(previous[1] + 1, POLL_BACKOFF_MAX_TICKS)
+            if previous and previous[0] == newest
+            else 0
+        )
+        ticks = min(2**quiet, POLL_BACKOFF_MAX_TICKS)
+        # A minute of slack so the wall-clock tick that is due never lands just short
+        next_check = polled_at + ticks * POLL_INTERVAL - timedelta(minutes=1)
+        self._poll_state[yt_channel_id] = (newest, quiet, next_check)
 
-    async def send_notification(self, config: dict, video_info: dict):
+    def resolve_targets(self, config):
         """
-        Send a YouTube upload notification to the configured Discord channel.
+        Return `(guild, channel, role)` for a config, or None if guild/channel are gone.
 
-        Parameters
-        ----------
-        config : dict
-            Row from `youtube_notification_config` containing guild/channel/role info.
-        video_info : dict
-            Extracted video metadata from `extract_video_info`.
+        Resolved objects are cached per `(guild_id, yt_channel_id)` and reused
+        until the config row's `updated_at` changes.
         """
+        key = (config["guild_id"], config["yt_channel_id"])
+        version = config["updated_at"]
+        cached = self._resolved.get(key)
+        if cached and cached[0] == version:
+            return cached[1]
+
         guild = self.bot.get_guild(int(config["guild_id"]))
         if not guild:
             log.warning(f"Guild {config['guild_id']} not found")
-            return
+            return None
 
-        channel = self.bot.get_channel(int(config["target_channel_id"]))
+        channel = guild.get_channel(config["target_channel_id"])
         if not channel:
             log.warning(
                 f"Channel {config['target_channel_id']} not found in guild {guild.id}"
             )
-            return
+            return None
 
         role = (
-            guild.get_role(int(config["mention_role_id"]))
-            if config.get("mention_role_id")
+            guild.get_role(config["mention_role_id"])
+            if config["mention_role_id"]
             else None
         )
+        targets = (guild, channel, role)
+        self._resolved[key] = (version, targets)
+        return targets
 
-        message_template = config.get(
-            "custom_message",
-            "🔔 {@role} **{channel_name}** has uploaded a new video!\n\n**{video_title}**\n{video_url}",
+    @tasks.loop(hours=24)
+    async def prune_video_logs(self):
+        """
+        Delete video log rows older than LOG_RETENTION_DAYS.
+
+        Keeps the log table and its indexes small. A pruned video that is
+        still in a feed is past the notify cutoff, so it is only re-logged.
+        """
+        result = await self.pool.execute(
+            f"DELETE FROM public.youtube_notification_logs WHERE notified_at < NOW() - INTERVAL '{LOG_RETENTION_DAYS} days'"
         )
+        log.info(f"🧹 Pruned YouTube notification logs: {result}")
 
-        message = message_template.replace("{channel_name}", video_info["channel_name"])
-        message = message.replace("{video_title}", video_info["title"])
-        message = message.replace("{video_url}", video_info["link"])
-        message = message.replace("{@everyone}", "@everyone")
-        message = message.replace("{@here}", "@here")
+    @prune_video_logs.before_loop
+    async def before_prune_video_logs(self):
+        await self.bot.wait_until_ready()
 
-        if role:
-            message = message.replace("{@role}", role.mention)
-        else:
-            message = message.replace("{@role} ", "")
-            message = message.replace("{@role}", "")
+    async def send_notification(self, config: dict, video_info: dict):
+        """
+        Send a YouTube upload notification to the configured Discord channel.
+
+        Parameters
+        ----------
+        config : dict
+            Row from `youtube_notification_config` containing guild/channel/role info.
+        video_info : dict
+            Extracted video metadata from `_extract_video_info`.
+        """
+        targets = self.resolve_targets(config)
+        if not targets:
+            return
+        guild, channel, role = targets
+
+        message_template = config.get("custom_message") or DEFAULT_NOTIFICATION_MESSAGE
+
+        # Single pass over the template; "{@role} " (with its space) vanishes when there is no role
+        values = {
+            "channel_name": video_info["channel_name"],
+            "video_title": video_info["title"],
+            "video_url": video_info["link"],
+            "@everyone": "@everyone",
+            "@here": "@here",
+            "@role": role.mention if role else "",
+        }
+
+        def substitute(match):
+            value = values[match.group(1)]
+            return value + match.group(2) if value else ""
 
+        message = _PLACEHOLDER_RE.sub(substitute, message_template)
         message = message.replace("  ", " ").strip()
 
         try:
@@ -509,21 +844,20 @@ class YouTubeManager:
                 f"⚠️ Missing permissions to send YouTube notification in channel {channel.id} "
                 f"of guild {guild.id}"
             )
+        except discord.NotFound:
+            # Channel deleted since it was cached; re-resolve next time
+            self._resolved.pop((config["guild_id"], config["yt_channel_id"]), None)
+            log.warning(f"Channel {channel.id} of guild {guild.id} no longer exists")
         except Exception as e:
             log.error(f"❌ Failed to send YouTube notification: {e}", exc_info=True)
 
     @check_for_videos.before_loop
     async def before_check_for_videos(self):
         """
-        Align the periodic task to run on 15-minute boundaries.
-
-        Waits until the bot is ready, then sleeps until the next quarter hour
-        (e.g. hh:00, hh:15, hh:30, hh:45) in IST before the first run.
+        Wait until the bot is ready; the loop itself fires on the CHECK_TIMES
+        wall-clock boundaries, so no manual alignment is needed.
         """
         await self.bot.wait_until_ready()
-        now = datetime.now(IST)
-        minutes_to_wait = 15 - (now.minute % 15)
-        await asyncio.sleep((minutes_to_wait * 60) - now.second)
 
     # ===========================
     # Slash command registration
@@ -571,12 +905,12 @@ class YouTubeManager:
             custom_url = ""
 
             try:
-                if channel_input.startswith("UC") and len(channel_input) == 24:
+                if _CHANNEL_ID_RE.fullmatch(channel_input):
                     channel_id = channel_input
                     log.info(f"Input '{channel_input}' is a direct channel ID.")
 
                 elif "/channel/" in channel_input:
-                    match = re.search(r"/channel/([A-Za-z0-9_-]{24})", channel_input)
+                    match = _CHANNEL_URL_RE.search(channel_input)
                     if match:
                         channel_id = match.group(1)
                         log.info(f"Extracted channel ID from URL: {channel_id}")
@@ -636,7 +970,7 @@ class YouTubeManager:
                 log.info(f"Verifying channel ID via RSS: {channel_id}")
 
                 feed = await self.fetch_rss_feed(channel_id)
-                if not feed or not feed.feed:
+                if not feed or not feed.title:
                     log.error(f"RSS verification failed for ID '{channel_id}'")
                     await interaction.followup.send(
                         f"❌ Found potential ID `{channel_id}`, but couldn't verify it.\n"
@@ -645,7 +979,7 @@ class YouTubeManager:
                     return
 
                 if not channel_name:
-                    channel_name = feed.feed.get("title", "Unknown Channel")
+                    channel_name = feed.title
 
                 channel_url = f"https://www.youtube.com/channel/{channel_id}"
 
@@ -722,7 +1056,7 @@ class YouTubeManager:
             """
             await interaction.response.defer(ephemeral=True)
 
-            if not youtube_channel_id.startswith("UC"):
+            if not _CHANNEL_ID_RE.fullmatch(youtube_channel_id):
                 await interaction.followup.send(
                     "❌ That is not a valid YouTube Channel ID. It must start with `UC`.\nUse `/y1-find-youtube-channel-id` to find it."
                 )
@@ -730,84 +1064,48 @@ class YouTubeManager:
 
             try:
                 feed = await self.fetch_rss_feed(youtube_channel_id)
-                if not feed or not feed.feed:
+                if not feed or not feed.title:
                     await interaction.followup.send(
                         "❌ Could not find a channel with that ID. Please double-check it."
                     )
                     return
 
-                channel_name = feed.feed.get("title", "Unknown Channel")
+                channel_name = feed.title
                 guild_id = str(interaction.guild_id)
 
-                existing = await self.pool.fetchrow(
-                    "SELECT * FROM public.youtube_notification_config WHERE guild_id = $1 AND yt_channel_id = $2",
+                # One upsert; custom_message is only overwritten when a new one is given
+                inserted = await self.pool.fetchval(
+                    SQL_UPSERT_CONFIG,
                     guild_id,
                     youtube_channel_id,
+                    notification_channel.id,
+                    role_to_mention.id,
+                    channel_name,
+                    custom_message,
+                    DEFAULT_NOTIFICATION_MESSAGE,
                 )
 
-                default_message = (
-                    "🔔 {@role} **{channel_name}** has uploaded a new video!\n\n"
-                    "**{video_title}**\n{video_url}"
-                )
-
-                final_message = custom_message if custom_message else default_message
-
-                if existing:
-                    fields = [
-                        "target_channel_id = $1",
-                        "mention_role_id = $2",
-                        "is_enabled = TRUE",
-                        "yt_channel_name = $5",
-                        "updated_at = NOW()",
-                    ]
-                    params = [
-                        str(notification_channel.id),
-                        str(role_to_mention.id),
-                        guild_id,
-                        youtube_channel_id,
-                        channel_name,
-                    ]
-
-                    if custom_message:
-                        fields.append(f"custom_message = ${len(params) + 1}")
-                        params.append(custom_message)
-
-                    await self.pool.execute(
-                        f"""UPDATE public.youtube_notification_config 
-                        SET {', '.join(fields)}
-                        WHERE guild_id = $3 AND yt_channel_id = $4""",
-                        *params,
-                    )
-
+                if not inserted:
                     await interaction.followup.send(
                         f"✅ Updated YouTube notifications for **{channel_name}**.\n"
                         f"Notifications will be posted in {notification_channel.mention} with {role_to_mention.mention}."
                     )
                 else:
-                    await self.pool.execute(
-                        """INSERT INTO public.youtube_notification_config 
-                        (guild_id, yt_channel_id, target_channel_id, mention_role_id, 
-                            is_enabled, yt_channel_name, custom_message) 
-                        VALUES ($1, $2, $3, $4, TRUE, $5, $6)""",
-                        guild_id,
-                        youtube_channel_id,
-                        str(notification_channel.id),
-                        str(role_to_mention.id),
-                        channel_name,
-                        final_message,
-                    )
-
-                    await interaction.followup.send(
+                    header = (
                         f"✅ Set up YouTube notifications for **{channel_name}**!\n"
                         f"Notifications will be posted in {notification_channel.mention} with {role_to_mention.mention}.\n\n"
-                        f"🔄 Seeding recent videos to prevent old notifications..."
+                    )
+                    message = await interaction.followup.send(
+                        header + "🔄 Seeding recent videos to prevent old notifications...",
+                        wait=True,
                     )
 
                     seeded_count = await self.seed_channel(guild_id, youtube_channel_id)
 
-                    await interaction.channel.send(
-                        f"✅ **Seeding Complete!** Seeded {seeded_count} videos from **{channel_name}**.",
-                        delete_after=45,
+                    # Update the same followup rather than posting a second message
+                    await message.edit(
+                        content=header
+                        + f"✅ **Seeding Complete!** Seeded {seeded_count} videos from **{channel_name}**."
                     )
 
             except Exception as e:
@@ -838,13 +1136,13 @@ class YouTubeManager:
             await interaction.response.defer(ephemeral=True)
             guild_id = str(interaction.guild_id)
 
-            result = await self.pool.execute(
-                "DELETE FROM public.youtube_notification_config WHERE guild_id = $1 AND yt_channel_id = $2",
+            deleted = await self.pool.fetchval(
+                SQL_DELETE_CONFIG,
                 guild_id,
                 youtube_channel_id,
             )
 
-            if "DELETE 0" in result:
+            if deleted is None:
                 await interaction.followup.send(
                     "❌ No notifications found for that channel ID in this server."
                 )
@@ -872,7 +1170,7 @@ class YouTubeManager:
             guild_id = str(interaction.guild_id)
 
             configs = await self.pool.fetch(
-                "SELECT * FROM public.youtube_notification_config WHERE guild_id = $1 ORDER BY yt_channel_name",
+                SQL_LIST_CONFIGS,
                 guild_id,
             )
 
@@ -887,22 +1185,25 @@ class YouTubeManager:
                 color=0xFF0000,
             )
 
-            for config in configs:
-                status = "✅ Enabled" if config["is_enabled"] else "❌ Disabled"
-                channel = self.bot.get_channel(int(config["target_channel_id"]))
-                role_id = config.get("mention_role_id")
-                role = interaction.guild.get_role(int(role_id)) if role_id else None
-                channel_name = config.get("yt_channel_name") or "Unknown Name"
-
-                embed.add_field(
-                    name=f"🎬 {channel_name}",
-                    value=f"**ID:** `{config['yt_channel_id']}`\n"
-                    f"**Status:** {status}\n"
+            # Guild-scoped getters are single dict lookups; bot.get_channel walks every guild
+            guild = interaction.guild
+
+            def describe(config):
+                channel = guild.get_channel(config["target_channel_id"])
+                role_id = config["mention_role_id"]
+                role = guild.get_role(role_id) if role_id else None
+                return (
+                    f"🎬 {config.get('yt_channel_name') or 'Unknown Name'}",
+                    f"**ID:** `{config['yt_channel_id']}`\n"
+                    f"**Status:** {'✅ Enabled' if config['is_enabled'] else '❌ Disabled'}\n"
                     f"**Posts in:** {channel.mention if channel else '`Channel Deleted`'}\n"
                     f"**Mentions:** {role.mention if role else '`@here`'}",
-                    inline=False,
                 )
 
+            fields = [describe(config) for config in configs]
+            for name, value in fields:
+                embed.add_field(name=name, value=value, inline=False)
+
             await interaction.followup.send(embed=embed)
 
         @self.bot.tree.command(
@@ -933,24 +1234,24 @@ class YouTubeManager:
                     )
                     return
 
-                channel_name = feed.feed.get("title", "Unknown Channel")
+                channel_name = feed.title or "Unknown Channel"
                 embed = discord.Embed(
                     title=f"🎬 RSS Feed Test: {channel_name}",
                     description=f"Found {len(feed.entries)} video(s) in the feed. Showing the 5 most recent:",
                     color=0xFF0000,
                 )
 
-                for i, entry in enumerate(feed.entries[:5]):
-                    video_info = self.extract_video_info(entry)
-                    if not video_info:
-                        continue
-
-                    embed.add_field(
-                        name=f"{i+1}. {video_info['title'][:250]}",
-                        value=f"**Published:** {discord.utils.format_dt(video_info['published_at'], 'R')}\n"
+                # Entries were already extracted off-loop by _parse_yt_feed; just format them
+                fields = [
+                    (
+                        f"{i}. {video_info['title'][:250]}",
+                        f"**Published:** {discord.utils.format_dt(video_info['published_at'], 'R')}\n"
                         f"**Link:** [Watch Video]({video_info['link']})",
-                        inline=False,
                     )
+                    for i, video_info in enumerate(feed.entries[:5], start=1)
+                ]
+                for name, value in fields:
+                    embed.add_field(name=name, value=value, inline=False)
 
                 await interaction.followup.send(embed=embed)
 
@@ -17,11 +17,13 @@ import sys
 import os
 import threading
 import time
+import socket
 import asyncio
 import importlib
 import logging
 from pathlib import Path
-from typing import Optional, Callable, Any
+from types import ModuleType
+from typing import Optional, Callable, Any, List
 
 # ---------------------------------------------------------
 # 1. SETUP PATHS
@@ -37,6 +39,8 @@ sys.path.insert(0, str(FLASK_DIR))
 # 2. CONFIGURATION
 # ---------------------------------------------------------
 SERVER_PORT = os.getenv("FLASK_PORT", "5000")
+SERVER_HOST = os.getenv("FLASK_HOST", "0.0.0.0")
+FLASK_READY_TIMEOUT = float(os.getenv("FLASK_READY_TIMEOUT", "15"))
 
 # Configure logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -48,6 +52,10 @@ logging.basicConfig(
 logging.getLogger("werkzeug").setLevel(logging.WARNING)
 logger = logging.getLogger("run_production_consolidated")
 
+# Shutdown hooks registered as modules load, so shutdown never has to re-import them
+SHUTDOWN_CANDIDATES = ("shutdown", "close", "stop")
+_cleanup_callbacks: List[Callable[[], Any]] = []
+
 
 # ---------------------------------------------------------
 # 3. THREAD FUNCTIONS
@@ -64,10 +72,11 @@ def start_flask_thread() -> None:
     logger.info("Starting Flask server (CONSOLIDATED MODE - port %s).", SERVER_PORT)
     logger.info("📦 Using consolidated assets: app_hcj.css, app_hcj.js")
     try:
-        app_module = importlib.import_module("app_hcj") 
+        app_module = importlib.import_module("app_hcj")
     except Exception:
         logger.exception("Failed to import Flask app module 'app_hcj'.")
         return
+    _register_cleanup(app_module)
 
     run_flask: Optional[Callable[[], Any]] = getattr(app_module, "run_flask_app", None)
     if not callable(run_flask):
@@ -92,6 +101,7 @@ def start_discord_bot() -> None:
     except Exception:
         logger.exception("Failed to import Discord bot module 'supporter'.")
         return
+    _register_cleanup(supporter_module)
 
     run_bot: Optional[Callable[[], Any]] = getattr(supporter_module, "run_bot", None)
     if not callable(run_bot):
@@ -104,31 +114,67 @@ def start_discord_bot() -> None:
         logger.exception("Error while running Discord bot.")
 
 
-def _attempt_module_shutdown(
-    module_name: str, candidates: tuple = ("shutdown", "close", "stop")
-) -> None:
+def wait_for_flask(thread: threading.Thread, timeout: float = FLASK_READY_TIMEOUT) -> bool:
     """
-    Attempt to call a shutdown-style function on a module if present.
-    If the function is a coroutine, run it with asyncio.run.
+    Block until the Flask server accepts TCP connections on SERVER_HOST:SERVER_PORT.
+
+    Wildcard binds ("0.0.0.0", "::" or empty) are probed via loopback.
+
+    Returns True once a connection succeeds, False if the Flask thread dies
+    first or the timeout expires.
     """
-    try:
-        mod = importlib.import_module(module_name)
-    except Exception:
-        logger.debug("Module %s not importable for shutdown attempt.", module_name)
-        return
+    host = SERVER_HOST
+    if host in ("", "0.0.0.0"):
+        host = "127.0.0.1"
+    elif host == "::":
+        host = "::1"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not thread.is_alive():
+            return False
+        try:
+            with socket.create_connection((host, int(SERVER_PORT)), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
 
-    for name in candidates:
+def _register_cleanup(mod: ModuleType) -> None:
+    """
+    Register the module's first shutdown-style function (see SHUTDOWN_CANDIDATES).
+    """
+    for name in SHUTDOWN_CANDIDATES:
         func = getattr(mod, name, None)
         if callable(func):
-            try:
-                logger.info("Calling %s.%s() for graceful shutdown.", module_name, name)
-                result = func()
-                if asyncio.iscoroutine(result):
-                    asyncio.run(result)
-            except Exception:
-                logger.exception("Error while calling %s.%s()", module_name, name)
-            finally:
-                return
+            logger.debug("Registered %s.%s() for graceful shutdown.", mod.__name__, name)
+            _cleanup_callbacks.append(func)
+            return
+
+
+async def _gather_cleanups(coros: list) -> None:
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error("Error during graceful shutdown.", exc_info=result)
+
+
+def _run_cleanup_callbacks() -> None:
+    """
+    Call every registered shutdown hook. Coroutine hooks run concurrently
+    in a single asyncio.run.
+    """
+    coros = []
+    for func in _cleanup_callbacks:
+        try:
+            logger.info("Calling %s.%s() for graceful shutdown.", func.__module__, func.__name__)
+            result = func()
+            if asyncio.iscoroutine(result):
+                coros.append(result)
+        except Exception:
+            logger.exception("Error while calling %s()", func.__name__)
+    if coros:
+        asyncio.run(_gather_cleanups(coros))
 
 
 # ---------------------------------------------------------
@@ -146,6 +192,15 @@ if __name__ == "__main__":
             logger.debug("WindowsSelectorEventLoopPolicy set.")
         except Exception:
             logger.exception("Failed to set WindowsSelectorEventLoopPolicy.")
+    else:
+        # uvloop is optional; bot.run() -> asyncio.run() picks up the policy.
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("uvloop event loop policy enabled.")
+        except ImportError:
+            logger.debug("uvloop not installed; using default asyncio event loop.")
 
     # Verify directories exist before starting
     if not PYTHON_FILES_DIR.exists():
@@ -160,16 +215,20 @@ if __name__ == "__main__":
     )
     flask_thread.start()
 
-    # Short delay to allow the Flask thread to initialize
-    time.sleep(2)
+    # Wait until Flask is actually listening instead of guessing with a fixed delay
+    if wait_for_flask(flask_thread):
+        logger.info("Flask server is accepting connections on port %s.", SERVER_PORT)
+    else:
+        logger.warning(
+            "Flask server not reachable on port %s; starting Discord bot anyway.",
+            SERVER_PORT,
+        )
 
     try:
         start_discord_bot()
     except KeyboardInterrupt:
         logger.info("Stop signal received. Initiating graceful shutdown procedures.")
-        # Attempt to perform graceful shutdown on common modules
-        _attempt_module_shutdown("supporter")
-        _attempt_module_shutdown("app_hcj")  # ← Changed from "app"
+        _run_cleanup_callbacks()
     except Exception:
         logger.exception("Unhandled error in main execution.")
     finally: